@@ -35,13 +35,22 @@ def load_tidal_data():
     """Load the tidal data produced by Script 2"""
     print("Loading tidal data...")
 
+    # Prefer the binary copy from Script 2; fall back to the CSV
+    npz_file = f'{output_dir}/predicted_tide.npz'
     tidal_file = f'{output_dir}/predicted_tide.csv'
-    if not os.path.exists(tidal_file):
+    if os.path.exists(npz_file):
+        data = np.load(npz_file)
+        tidal_df = pd.DataFrame({
+            'Timestamp': pd.to_datetime(data['timestamps']),
+            'Original_SSH': data['original'],
+            'Predicted_SSH': data['predicted']
+        })
+    elif os.path.exists(tidal_file):
+        tidal_df = pd.read_csv(tidal_file)
+        tidal_df['Timestamp'] = pd.to_datetime(tidal_df['Timestamp'])
+    else:
         raise FileNotFoundError(f"Could not find {tidal_file}. Run Script 2 first.")
 
-    tidal_df = pd.read_csv(tidal_file)
-    tidal_df['Timestamp'] = pd.to_datetime(tidal_df['Timestamp'])
-
     print(f"Loaded tidal data with {len(tidal_df)} data points")
     return tidal_df
 
@@ -100,7 +109,7 @@ def analyze_surge_statistics(surge_df):
         extreme_events['event_group'] = (extreme_events['event_diff'] > 3).cumsum()
 
         # Find the peak of each event group
-        peak_events = extreme_events.groupby('event_group').apply(
+        peak_events = extreme_events.groupby('event_group', sort=False).apply(
             lambda x: x.loc[x['Storm_Surge'].abs().idxmax()]
         ).reset_index(drop=True)
 
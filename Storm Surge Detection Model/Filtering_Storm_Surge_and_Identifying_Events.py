@@ -182,32 +182,23 @@ def identify_surge_events(surge_df, std_multiplier=2):
         significant_events['event_diff'] = significant_events['Timestamp'].diff().dt.total_seconds() / 3600
         significant_events['event_group'] = (significant_events['event_diff'] > 3).cumsum()
 
-        # Find key characteristics of each event group
-        event_groups = []
-        for group_id, group in significant_events.groupby('event_group'):
-            # Find peak value
-            peak_idx = group['Filtered_Surge'].abs().idxmax()
-            peak_row = group.loc[peak_idx].copy()
-
-            # Calculate event duration
-            start_time = group['Timestamp'].min()
-            end_time = group['Timestamp'].max()
-            duration_hours = (end_time - start_time).total_seconds() / 3600
-
-            # Create event summary
-            event = {
-                'Start_Time': start_time,
-                'End_Time': end_time,
-                'Peak_Time': peak_row['Timestamp'],
-                'Duration_Hours': duration_hours,
-                'Peak_Surge': peak_row['Filtered_Surge'],
-                'Direction': 'Positive' if peak_row['Filtered_Surge'] > 0 else 'Negative',
-                'Event_Group': group_id
-            }
-            event_groups.append(event)
+        # Find key characteristics of each event group; the group ids are
+        # already in time order, so pandas does not need to sort them
+        event_ids = significant_events['event_group']
+        bounds = significant_events.groupby(event_ids, sort=False)['Timestamp'].agg(['min', 'max'])
+        peak_idx = significant_events['Filtered_Surge'].abs().groupby(event_ids, sort=False).idxmax()
+        peak_rows = significant_events.loc[peak_idx.values]
 
         # Create DataFrame of event summaries
-        events_df = pd.DataFrame(event_groups)
+        events_df = pd.DataFrame({
+            'Start_Time': bounds['min'].values,
+            'End_Time': bounds['max'].values,
+            'Peak_Time': peak_rows['Timestamp'].values,
+            'Duration_Hours': (bounds['max'] - bounds['min']).dt.total_seconds().values / 3600,
+            'Peak_Surge': peak_rows['Filtered_Surge'].values,
+            'Direction': np.where(peak_rows['Filtered_Surge'].values > 0, 'Positive', 'Negative'),
+            'Event_Group': bounds.index.values
+        })
 
         # Sort by absolute magnitude
         events_df = events_df.sort_values(by='Peak_Surge', key=abs, ascending=False)
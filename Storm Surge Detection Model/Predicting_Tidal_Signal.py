@@ -22,6 +22,9 @@ import matplotlib.dates as mdates
 from datetime import datetime
 import os
 
+# SSH loading is shared with Script 1
+from tidal_helpers import read_ssh_values
+
 # Create output directory for saving results
 output_dir = './tidal_analysis_results'
 os.makedirs(output_dir, exist_ok=True)
@@ -31,23 +34,7 @@ def load_original_data(file_path, has_header=False):
     """Load the original SSH data"""
     print(f"Loading original data from {file_path}...")
 
-    if has_header:
-        ssh_data = pd.read_csv(file_path)
-        ssh_values = ssh_data.iloc[:, 0].values
-    else:
-        ssh_data = pd.read_csv(file_path, header=None)
-        ssh_values = ssh_data.iloc[:, 0].values
-
-    # Handle potential missing or non-numeric data
-    ssh_values = pd.to_numeric(ssh_values, errors='coerce')
-    if np.isnan(ssh_values).any():
-        print("Data contains NaN values. Filling missing data using linear interpolation...")
-        ssh_values = pd.Series(ssh_values).interpolate(method='linear', limit_direction='both').values
-
-    # Ensure 'ssh_values' is a one-dimensional array
-    ssh_values = ssh_values.flatten()
-
-    return ssh_values
+    return read_ssh_values(file_path, has_header)
 
 # Create time index for the data
 def create_time_index(length, start_date='2022-01-01', freq='h'):
@@ -67,7 +54,13 @@ def load_constituent_parameters():
         raise FileNotFoundError(f"Could not find {param_file}. Run Script 1 first.")
 
     data = np.load(param_file, allow_pickle=True)
-    params = data['params']
+    if 'cos_coeffs' in data.files:
+        cos_coeffs = data['cos_coeffs']
+        sin_coeffs = data['sin_coeffs']
+    else:
+        # Older parameter files store the coefficients interleaved
+        cos_coeffs = data['params'][0::2].copy()
+        sin_coeffs = data['params'][1::2].copy()
     intercept = data['intercept']
     frequencies = data['frequencies']
     constituent_names = data['constituent_names']
@@ -76,10 +69,10 @@ def load_constituent_parameters():
     constituent_df = pd.read_csv(f'{output_dir}/tidal_constituents.csv')
 
     print(f"Loaded parameters for {len(constituent_names)} constituents")
-    return params, intercept, frequencies, constituent_names, constituent_df
+    return cos_coeffs, sin_coeffs, intercept, frequencies, constituent_names, constituent_df
 
 # Create a prediction function using constituent parameters
-def predict_tide(t, params, intercept, frequencies):
+def predict_tide(t, cos_coeffs, sin_coeffs, intercept, frequencies):
     """
     Predict tidal heights using constituent parameters
 
@@ -87,8 +80,10 @@ def predict_tide(t, params, intercept, frequencies):
     -----------
     t : numpy.ndarray
         Time vector (numeric indices)
-    params : numpy.ndarray
-        Model coefficients
+    cos_coeffs : numpy.ndarray
+        Cosine coefficient of each constituent
+    sin_coeffs : numpy.ndarray
+        Sine coefficient of each constituent
     intercept : float
         Model intercept
     frequencies : numpy.ndarray
@@ -101,20 +96,21 @@ def predict_tide(t, params, intercept, frequencies):
     """
     print("Predicting tidal signal...")
 
-    # Create design matrix for prediction
-    X_pred = np.zeros((len(t), 2 * len(frequencies)))
-    for i, freq in enumerate(frequencies):
-        X_pred[:, 2*i] = np.cos(2 * np.pi * freq * t)
-        X_pred[:, 2*i+1] = np.sin(2 * np.pi * freq * t)
+    # Build the phase of every constituent at every time step in one call,
+    # then evaluate cosine and sine over the whole matrix in place
+    phase = np.empty((len(t), len(frequencies)), dtype=np.float64)
+    np.multiply(t[:, None], 2 * np.pi * frequencies[None, :], out=phase)
+    cos_part = np.cos(phase)
+    sin_part = np.sin(phase, out=phase)
 
     # Calculate predicted values
-    predicted_ssh = X_pred.dot(params) + intercept
+    predicted_ssh = cos_part @ cos_coeffs + sin_part @ sin_coeffs + intercept
 
     print("Tidal prediction complete")
     return predicted_ssh
 
 # Function to demonstrate individual constituent contributions
-def visualize_constituent_contributions(time_index, frequencies, params, intercept, constituent_names, top_n=3):
+def visualize_constituent_contributions(time_index, frequencies, cos_coeffs, sin_coeffs, intercept, constituent_names, top_n=3):
     """
     Visualize how individual top constituents contribute to the overall tide
 
@@ -126,8 +122,6 @@ def visualize_constituent_contributions(time_index, frequencies, params, interce
     t = np.arange(len(time_index))
 
     # Get indices of top constituents by amplitude
-    cos_coeffs = params[0::2]
-    sin_coeffs = params[1::2]
     amplitudes = np.sqrt(cos_coeffs**2 + sin_coeffs**2)
     top_indices = np.argsort(amplitudes)[::-1][:top_n]
 
@@ -136,13 +130,10 @@ def visualize_constituent_contributions(time_index, frequencies, params, interce
 
     # Plot each top constituent individually
     for i, idx in enumerate(top_indices):
-        # Create design matrix with just this constituent
-        X_single = np.zeros((len(t), 2 * len(frequencies)))
-        X_single[:, 2*idx] = np.cos(2 * np.pi * frequencies[idx] * t)
-        X_single[:, 2*idx+1] = np.sin(2 * np.pi * frequencies[idx] * t)
-
         # Calculate contribution of just this constituent
-        single_contribution = X_single.dot(params) + (intercept / len(frequencies))
+        single_contribution = (cos_coeffs[idx] * np.cos(2 * np.pi * frequencies[idx] * t)
+                               + sin_coeffs[idx] * np.sin(2 * np.pi * frequencies[idx] * t)
+                               + (intercept / len(frequencies)))
 
         # Plot
         constituent = constituent_names[idx]
@@ -158,11 +149,8 @@ def visualize_constituent_contributions(time_index, frequencies, params, interce
                     transform=axes[i].transAxes, bbox=dict(facecolor='white', alpha=0.7))
 
     # Calculate full predicted tide (all constituents)
-    X_full = np.zeros((len(t), 2 * len(frequencies)))
-    for i, freq in enumerate(frequencies):
-        X_full[:, 2*i] = np.cos(2 * np.pi * freq * t)
-        X_full[:, 2*i+1] = np.sin(2 * np.pi * freq * t)
-    full_tide = X_full.dot(params) + intercept
+    phase = np.multiply.outer(t, 2 * np.pi * frequencies)
+    full_tide = np.cos(phase) @ cos_coeffs + np.sin(phase) @ sin_coeffs + intercept
 
     # Plot full tide
     axes[-1].plot(time_index[:168], full_tide[:168], 'r-', label='Complete tidal prediction')
@@ -190,14 +178,14 @@ def predict_tidal_signal(file_path, start_date='2022-01-01', has_header=False):
     original_ssh = load_original_data(file_path, has_header)
 
     # Load constituent parameters from Script 1
-    params, intercept, frequencies, constituent_names, constituent_df = load_constituent_parameters()
+    cos_coeffs, sin_coeffs, intercept, frequencies, constituent_names, constituent_df = load_constituent_parameters()
 
     # Create time vectors
     t = np.arange(len(original_ssh))
     time_index = create_time_index(len(original_ssh), start_date)
 
     # Predict tidal signal using the constituent parameters
-    predicted_ssh = predict_tide(t, params, intercept, frequencies)
+    predicted_ssh = predict_tide(t, cos_coeffs, sin_coeffs, intercept, frequencies)
 
     # Create DataFrame with both original and predicted data
     tidal_df = pd.DataFrame({
@@ -207,8 +195,16 @@ def predict_tidal_signal(file_path, start_date='2022-01-01', has_header=False):
     })
 
     # Save the predicted tide data
+    # The NPZ keeps the arrays in binary form (timestamps included); the CSV is
+    # kept for Script 3 and written with fixed formats to skip per-value inference
     print("Saving predicted tide data...")
-    tidal_df.to_csv(f'{output_dir}/predicted_tide.csv', index=False)
+    np.savez_compressed(f'{output_dir}/predicted_tide.npz',
+                        timestamps=time_index.values.astype('datetime64[s]'),
+                        original=original_ssh,
+                        predicted=predicted_ssh)
+    tidal_df.to_csv(f'{output_dir}/predicted_tide.csv', index=False,
+                    float_format='%.6g', date_format='%Y-%m-%d %H:%M:%S',
+                    chunksize=10000)
 
     # Visualize original and predicted tides (full time series)
     print("Creating visualizations...")
@@ -221,13 +217,13 @@ def predict_tidal_signal(file_path, start_date='2022-01-01', has_header=False):
     ax.xaxis.set_major_locator(mdates.MonthLocator())
     fig.autofmt_xdate()
 
-    plt.xlabel('Date')
-    plt.ylabel('Sea Surface Height (m)')
-    plt.title('Comparison of Original and Predicted Sea Surface Height')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/ssh_comparison_full.png', dpi=300)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Sea Surface Height (m)')
+    ax.set_title('Comparison of Original and Predicted Sea Surface Height')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/ssh_comparison_full.png', dpi=300)
     plt.show()
 
     # Show a shorter time period (one week) for better detail
@@ -241,19 +237,20 @@ def predict_tidal_signal(file_path, start_date='2022-01-01', has_header=False):
     ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
     fig.autofmt_xdate()
 
-    plt.xlabel('Date')
-    plt.ylabel('Sea Surface Height (m)')
-    plt.title('Comparison of Original and Predicted Sea Surface Height (7-Day Sample)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/ssh_comparison_week.png', dpi=300)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Sea Surface Height (m)')
+    ax.set_title('Comparison of Original and Predicted Sea Surface Height (7-Day Sample)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/ssh_comparison_week.png', dpi=300)
     plt.show()
 
     # Visualize the contributions of top constituents (educational)
-    visualize_constituent_contributions(time_index, frequencies, params, intercept, constituent_names)
+    visualize_constituent_contributions(time_index, frequencies, cos_coeffs, sin_coeffs, intercept, constituent_names)
 
     print(f"\nAll predicted tide data saved to {output_dir}/predicted_tide.csv")
+    print(f"Binary copy saved to {output_dir}/predicted_tide.npz")
 
     return tidal_df
 
@@ -15,15 +15,36 @@
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['figure.max_open_warning'] = 0
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
 from datetime import datetime, timedelta
+import hashlib
+import pickle
 import os
 
+# Numba is optional; without it the event grouping falls back to plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Create output directory for saving results
 output_dir = './tidal_analysis_results/threshold_analysis'
 os.makedirs(output_dir, exist_ok=True)
 
+# Columns needed for threshold analysis, read in a single parsing pass
+SURGE_COLUMNS = {'Timestamp', 'Storm_Surge', 'Filtered_Surge'}
+SURGE_DTYPES = {'Storm_Surge': np.float32, 'Filtered_Surge': np.float32}
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'  # As written by pandas in Scripts 3 and 4
+
+# Bump when the layout of the cached event results changes
+RESULTS_CACHE_VERSION = 1
+
 # Function to load surge data (uses previous analysis results)
 def load_surge_data():
     """Load surge data from previous analysis steps"""
@@ -32,28 +53,103 @@ def load_surge_data():
     # Try to load filtered surge data first
     filtered_file = './tidal_analysis_results/filtered_surge.csv'
     if os.path.exists(filtered_file):
-        surge_df = pd.read_csv(filtered_file)
+        source_file = filtered_file
+        surge_df = pd.read_csv(filtered_file, usecols=lambda c: c in SURGE_COLUMNS,
+                               parse_dates=['Timestamp'], date_format=TIMESTAMP_FORMAT,
+                               dtype=SURGE_DTYPES)
         has_filtered = True
     else:
         # If filtered data not available, use raw surge
         raw_file = './tidal_analysis_results/storm_surge_raw.csv'
         if not os.path.exists(raw_file):
             raise FileNotFoundError("No surge data found. Run previous analysis scripts first.")
-        surge_df = pd.read_csv(raw_file)
+        source_file = raw_file
+        surge_df = pd.read_csv(raw_file, usecols=lambda c: c in SURGE_COLUMNS,
+                               parse_dates=['Timestamp'], date_format=TIMESTAMP_FORMAT,
+                               dtype=SURGE_DTYPES)
         # Create a placeholder filtered surge column if it doesn't exist
         if 'Filtered_Surge' not in surge_df.columns:
             surge_df['Filtered_Surge'] = surge_df['Storm_Surge']
         has_filtered = False
 
-    # Ensure timestamp is datetime
-    surge_df['Timestamp'] = pd.to_datetime(surge_df['Timestamp'])
+    # Remember a fingerprint of the input so event results can be cached
+    with open(source_file, 'rb') as f:
+        surge_df.attrs['source_hash'] = hashlib.md5(f.read()).hexdigest()
 
     print(f"Loaded {len(surge_df)} data points")
     return surge_df, has_filtered
 
+# Function to locate the cached event results for a given input and parameter set
+def get_results_cache_file(surge_df, threshold_factors, min_durations, use_filtered):
+    """
+    Return the cache file and signature for these inputs, or (None, None) if the
+    input has no fingerprint
+
+    There is one cache file per surge type (filtered or raw). The signature of the
+    input and parameters is stored inside it, so a new run overwrites the old
+    results instead of adding another file.
+    """
+    source_hash = surge_df.attrs.get('source_hash')
+    if source_hash is None:
+        return None, None
+
+    signature = repr((RESULTS_CACHE_VERSION, source_hash, list(threshold_factors), list(min_durations), use_filtered))
+    mode = 'filtered' if use_filtered else 'raw'
+    return f'{output_dir}/_cache_{mode}.pkl', signature
+
+# Function to summarise runs of consecutive exceedances
+def summarize_exceedance_runs(ex_sec, ex_values, gap_sec):
+    """
+    Find the start, end and peak of each run of exceedances
+
+    Exceedances less than gap_sec apart belong to the same event. Returns
+    (start_sec, end_sec, peak_pos) with one entry per event, where peak_pos
+    indexes the exceedance with the largest absolute surge.
+    """
+    # A new event starts wherever the gap to the previous exceedance is too large
+    new_event = np.diff(ex_sec) > gap_sec
+    group_ids = np.concatenate(([0], np.cumsum(new_event, dtype=np.int32)))
+    starts = np.flatnonzero(np.concatenate(([True], new_event)))
+
+    # Start and end of every group in one pass
+    start_sec = np.minimum.reduceat(ex_sec, starts)
+    end_sec = np.maximum.reduceat(ex_sec, starts)
+
+    # Ordering by group, then by descending magnitude, puts each group's
+    # peak at that group's start position
+    peak_pos = np.lexsort((-np.abs(ex_values), group_ids))[starts]
+
+    return start_sec, end_sec, peak_pos
+
+if njit is not None:
+    # Compiled single-pass version of the function above, used when Numba is installed
+    @njit(cache=True)
+    def summarize_exceedance_runs(ex_sec, ex_values, gap_sec):
+        n = len(ex_sec)
+        start_sec = np.empty(n, dtype=np.int64)
+        end_sec = np.empty(n, dtype=np.int64)
+        peak_pos = np.empty(n, dtype=np.int64)
+
+        n_events = 0
+        run_start = 0
+        peak = 0
+        for i in range(1, n + 1):
+            if i == n or ex_sec[i] - ex_sec[i - 1] > gap_sec:
+                # Close the current run
+                start_sec[n_events] = ex_sec[run_start]
+                end_sec[n_events] = ex_sec[i - 1]
+                peak_pos[n_events] = peak
+                n_events += 1
+                run_start = i
+                peak = i
+            elif abs(ex_values[i]) > abs(ex_values[peak]):
+                peak = i
+
+        return start_sec[:n_events], end_sec[:n_events], peak_pos[:n_events]
+
 # Function to identify events using different thresholds and methods
 def identify_events_with_thresholds(surge_df, threshold_factors=[1.0, 1.5, 2.0, 2.5, 3.0],
-                                   min_durations=[1, 3, 6], use_filtered=True):
+                                   min_durations=[1, 3, 6], use_filtered=True, use_cache=True):
     """
     Identify surge events using different threshold levels and duration requirements
 
@@ -67,22 +163,48 @@ def identify_events_with_thresholds(surge_df, threshold_factors=[1.0, 1.5, 2.0,
         List of minimum durations (in hours) required for an event
     use_filtered : bool, optional
         Whether to use filtered or raw surge data
+    use_cache : bool, optional
+        Whether to reuse results saved by a previous run on the same input
 
     Returns:
     --------
     dict
-        Dictionary of event information for each threshold and duration
+        Dictionary of event information for each threshold and duration.
+        Event times (Start_Time, End_Time, Peak_Time) are int64 seconds since
+        the epoch; convert with pd.to_datetime(..., unit='s') for display
     """
+    # Reuse results from a previous run on identical data and parameters
+    cache_file, signature = (get_results_cache_file(surge_df, threshold_factors, min_durations, use_filtered)
+                             if use_cache else (None, None))
+    if cache_file is not None and os.path.exists(cache_file):
+        # A truncated or incompatible cache file is ignored and rewritten below
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_signature, cached_results = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            print(f"Ignoring unreadable cache file {cache_file}")
+            cached_signature = None
+        if cached_signature == signature:
+            print(f"Loading cached event results from {cache_file}...")
+            return cached_results
+
     print("Identifying events with different thresholds...")
 
     # Select which surge data to use
     surge_column = 'Filtered_Surge' if use_filtered else 'Storm_Surge'
     surge_values = surge_df[surge_column].values
+    # Timestamps as integer seconds so gaps and durations are plain integer arithmetic
+    ts_sec = surge_df['Timestamp'].values.astype('datetime64[s]').view(np.int64)
 
     # Calculate statistics
     surge_mean = np.mean(surge_values)
     surge_std = np.std(surge_values)
 
+    # Absolute deviations are shared by every threshold: each higher threshold's
+    # exceedances are a subset of those at the lowest one
+    abs_dev = np.abs(surge_values - surge_mean)
+    candidates = np.flatnonzero(abs_dev > min(threshold_factors) * surge_std)
+
     # Store results
     results = {}
 
@@ -98,65 +220,58 @@ def identify_events_with_thresholds(surge_df, threshold_factors=[1.0, 1.5, 2.0,
         }
 
         # Identify exceedances (both positive and negative)
-        exceedances = surge_df[np.abs(surge_df[surge_column] - surge_mean) > threshold].copy()
+        ex_idx = candidates[abs_dev[candidates] > threshold]
+        ex_sec = ts_sec[ex_idx]
+        ex_values = surge_values[ex_idx]
+
+        # Summarise every exceedance group once; duration filters are applied below
+        if len(ex_values) > 0:
+            # Exceedances more than 3 hours apart belong to separate events
+            start_sec, end_sec, peak_pos = summarize_exceedance_runs(ex_sec, ex_values, 3 * 3600)
+        else:
+            # No events found
+            start_sec = end_sec = peak_pos = np.empty(0, dtype=np.int64)
+        duration_hours = (end_sec - start_sec) / 3600
+
+        # Order events by absolute magnitude before building the table
+        order = np.argsort(-np.abs(ex_values[peak_pos]), kind='stable')
+        peak_pos = peak_pos[order]
+        sorted_durations = duration_hours[order]
+        peak_values = ex_values[peak_pos]
+        is_positive = peak_values > surge_mean
+
+        # Create DataFrame of event summaries column by column with fixed dtypes
+        summary_df = pd.DataFrame({
+            'Start_Time': start_sec[order],
+            'End_Time': end_sec[order],
+            'Peak_Time': ex_sec[peak_pos],
+            'Duration_Hours': sorted_durations.astype(np.float32),
+            'Peak_Surge': peak_values.astype(np.float32),
+            'Direction': pd.Categorical.from_codes((~is_positive).astype(np.int8),
+                                                   categories=['Positive', 'Negative']),
+            'Event_Group': order.astype(np.int32)
+        })
 
         # For each minimum duration
         for min_duration in min_durations:
-            # Group consecutive exceedances
-            if len(exceedances) > 0:
-                # Add event group identifier
-                exceedances['event_diff'] = exceedances['Timestamp'].diff().dt.total_seconds() / 3600
-                exceedances['event_group'] = (exceedances['event_diff'] > 3).cumsum()
-
-                # Find characteristics of each event group
-                event_groups = []
-                for group_id, group in exceedances.groupby('event_group'):
-                    # Only include events that meet minimum duration
-                    duration_hours = (group['Timestamp'].max() - group['Timestamp'].min()).total_seconds() / 3600
-
-                    if duration_hours >= min_duration:
-                        # Find peak value
-                        peak_idx = group[surge_column].abs().idxmax()
-                        peak_row = group.loc[peak_idx].copy()
-
-                        # Create event summary
-                        event = {
-                            'Start_Time': group['Timestamp'].min(),
-                            'End_Time': group['Timestamp'].max(),
-                            'Peak_Time': peak_row['Timestamp'],
-                            'Duration_Hours': duration_hours,
-                            'Peak_Surge': peak_row[surge_column],
-                            'Direction': 'Positive' if peak_row[surge_column] > surge_mean else 'Negative',
-                            'Event_Group': group_id
-                        }
-                        event_groups.append(event)
-
-                # Create DataFrame of event summaries
-                if event_groups:
-                    events_df = pd.DataFrame(event_groups)
-                    # Sort by absolute magnitude
-                    events_df = events_df.sort_values(by='Peak_Surge', key=abs, ascending=False)
-                else:
-                    # Create empty DataFrame if no events found
-                    events_df = pd.DataFrame(columns=[
-                        'Start_Time', 'End_Time', 'Peak_Time', 'Duration_Hours',
-                        'Peak_Surge', 'Direction', 'Event_Group'
-                    ])
-            else:
-                # Create empty DataFrame if no events found
-                events_df = pd.DataFrame(columns=[
-                    'Start_Time', 'End_Time', 'Peak_Time', 'Duration_Hours',
-                    'Peak_Surge', 'Direction', 'Event_Group'
-                ])
+            # Only include events that meet minimum duration
+            keep = sorted_durations >= min_duration
+            events_df = summary_df[keep]
+            pos_count = int(np.count_nonzero(is_positive[keep]))
 
             # Store in results
             results[factor_key]['durations'][f"{min_duration}h"] = {
                 'events_df': events_df,
                 'count': len(events_df),
-                'pos_count': len(events_df[events_df['Direction'] == 'Positive']),
-                'neg_count': len(events_df[events_df['Direction'] == 'Negative'])
+                'pos_count': pos_count,
+                'neg_count': len(events_df) - pos_count
             }
 
+    # Save results so repeat runs on the same data can skip the computation
+    if cache_file is not None:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((signature, (results, surge_mean, surge_std)), f)
+
     print("Event identification complete")
     return results, surge_mean, surge_std
 
@@ -165,12 +280,27 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
     """Create visualizations showing how different thresholds affect event identification"""
     print("Creating threshold comparison visualizations...")
 
+    # Start from an empty figure registry so earlier calls cannot slow this one down
+    plt.close('all')
+
     # Select which surge data to use
     surge_column = 'Filtered_Surge' if use_filtered else 'Storm_Surge'
     data_type = 'Filtered' if use_filtered else 'Raw'
 
+    # Timestamps are sorted, so event spans can be located by binary search
+    ts_arr = surge_df['Timestamp'].values
+    ts_sec = ts_arr.astype('datetime64[s]').view(np.int64)
+    ts_num = mdates.date2num(ts_arr)
+    surge_arr = surge_df[surge_column].values
+
+    # The background series is drawn many times; ~10k points is plenty at this figure size.
+    # Event highlights still use the full-resolution arrays above
+    stride = max(1, len(surge_df) // 10000)
+    ts_plot = ts_arr[::stride]
+    val_plot = surge_arr[::stride]
+
     # Create bar chart showing number of events by threshold and duration
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8))
 
     # Extract data for plotting
     thresholds = list(results.keys())
@@ -198,21 +328,26 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     plt.savefig(f'{output_dir}/{data_type.lower()}_event_count_comparison.png', dpi=300)
-    plt.close()
+    plt.close(fig)
 
-    # Create plots for each threshold level showing the events
+    # Create plots for each threshold level showing the events.
+    # One figure with a subplot per duration requirement is reused for every threshold
+    fig, axes = plt.subplots(len(durations), 1, figsize=(14, 4*len(durations)), sharex=True)
     for threshold in thresholds:
-        threshold_value = results[threshold]['threshold_value']
+        # Nothing to highlight at this level; the report already notes it
+        if all(results[threshold]['durations'][d]['count'] == 0 for d in durations):
+            print(f"No {data_type.lower()} events at {threshold}, skipping event plot")
+            continue
 
-        # Create figure with subplots for each duration requirement
-        fig, axes = plt.subplots(len(durations), 1, figsize=(14, 4*len(durations)), sharex=True)
+        threshold_value = results[threshold]['threshold_value']
 
         for i, duration in enumerate(durations):
             ax = axes[i]
+            ax.clear()
             events = results[threshold]['durations'][duration]['events_df']
 
             # Plot the surge data
-            ax.plot(surge_df['Timestamp'], surge_df[surge_column], color='blue', linewidth=1, alpha=0.7)
+            ax.plot(ts_plot, val_plot, color='blue', linewidth=1, alpha=0.7)
 
             # Add horizontal lines for thresholds
             ax.axhline(y=surge_mean, color='red', linestyle='-', alpha=0.5, label='Mean')
@@ -221,16 +356,17 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
             ax.axhline(y=surge_mean - threshold_value, color='orange', linestyle='--', alpha=0.7)
 
             # Highlight events
-            for _, event in events.iterrows():
-                color = 'red' if event['Direction'] == 'Positive' else 'purple'
-                # Mark peak
-                ax.plot(event['Peak_Time'], event['Peak_Surge'], 'o', color=color, markersize=8)
+            if len(events) > 0:
+                colors = np.where(events['Direction'] == 'Positive', 'red', 'purple')
+                # Mark peaks
+                peak_times = pd.to_datetime(events['Peak_Time'].values, unit='s')
+                ax.scatter(peak_times, events['Peak_Surge'], c=colors, s=64, zorder=3)
 
-                # Highlight full event duration
-                mask = (surge_df['Timestamp'] >= event['Start_Time']) & (surge_df['Timestamp'] <= event['End_Time'])
-                if any(mask):
-                    ax.plot(surge_df.loc[mask, 'Timestamp'], surge_df.loc[mask, surge_column],
-                           color=color, linewidth=2, alpha=0.7)
+                # Highlight full event durations as a single collection
+                lo = np.searchsorted(ts_sec, events['Start_Time'].values, side='left')
+                hi = np.searchsorted(ts_sec, events['End_Time'].values, side='right')
+                segments = [np.column_stack((ts_num[a:b], surge_arr[a:b])) for a, b in zip(lo, hi)]
+                ax.add_collection(LineCollection(segments, colors=colors, linewidths=2, alpha=0.7))
 
             # Add event count annotation
             count = len(events)
@@ -252,13 +388,13 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
         fig.autofmt_xdate()
 
         # Save figure
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/{data_type.lower()}_events_{threshold}_{durations[-1]}.png', dpi=300)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{output_dir}/{data_type.lower()}_events_{threshold}_{durations[-1]}.png', dpi=300)
+    plt.close(fig)
 
     # Create a 3σ and 1σ comparison (to show dramatic difference)
-    plt.figure(figsize=(14, 8))
-    plt.plot(surge_df['Timestamp'], surge_df[surge_column], color='blue', linewidth=1, alpha=0.7, label='Surge')
+    fig = plt.figure(figsize=(14, 8))
+    plt.plot(ts_plot, val_plot, color='blue', linewidth=1, alpha=0.7, label='Surge')
 
     # Add threshold lines
     plt.axhline(y=surge_mean, color='red', linestyle='-', alpha=0.5, label='Mean')
@@ -269,13 +405,13 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
 
     # Mark 3σ events
     events_3sigma = results['3.0σ']['durations']['3h']['events_df']
-    for _, event in events_3sigma.iterrows():
-        plt.plot(event['Peak_Time'], event['Peak_Surge'], 'o', color='purple', markersize=10)
+    if len(events_3sigma) > 0:
+        plt.scatter(pd.to_datetime(events_3sigma['Peak_Time'].values, unit='s'), events_3sigma['Peak_Surge'], marker='o', color='purple', s=100, zorder=3)
 
     # Mark 1σ events (only the top 20 to avoid cluttering)
     events_1sigma = results['1.0σ']['durations']['3h']['events_df'].head(20)
-    for _, event in events_1sigma.iterrows():
-        plt.plot(event['Peak_Time'], event['Peak_Surge'], 's', color='green', markersize=6)
+    if len(events_1sigma) > 0:
+        plt.scatter(pd.to_datetime(events_1sigma['Peak_Time'].values, unit='s'), events_1sigma['Peak_Surge'], marker='s', color='green', s=36, zorder=3)
 
     # Format axes
     plt.xlabel('Date')
@@ -297,7 +433,7 @@ def create_threshold_comparison_plots(surge_df, results, surge_mean, surge_std,
 
     plt.tight_layout()
     plt.savefig(f'{output_dir}/{data_type.lower()}_threshold_comparison.png', dpi=300)
-    plt.close()
+    plt.close(fig)
 
     print("Visualizations complete")
 
@@ -309,78 +445,79 @@ def generate_threshold_analysis_report(results, surge_mean, surge_std, use_filte
     data_type = 'Filtered' if use_filtered else 'Raw'
     report_file = f'{output_dir}/{data_type.lower()}_threshold_analysis_report.txt'
 
-    with open(report_file, 'w') as f:
-        f.write(f"STORM SURGE THRESHOLD ANALYSIS REPORT ({data_type} DATA)\n")
-        f.write("=================================================\n\n")
-
-        f.write("THRESHOLD STATISTICS\n")
-        f.write("-------------------\n")
-        f.write(f"Mean: {surge_mean:.4f} m\n")
-        f.write(f"Standard Deviation: {surge_std:.4f} m\n\n")
-
-        f.write("THRESHOLD VALUES\n")
-        f.write("---------------\n")
-        for threshold, data in results.items():
-            f.write(f"{threshold}: ±{data['threshold_value']:.4f} m\n")
-        f.write("\n")
-
-        # Event counts by threshold and duration
-        f.write("EVENT COUNTS BY THRESHOLD AND MINIMUM DURATION\n")
-        f.write("--------------------------------------------\n")
-
-        # Table header
-        thresholds = list(results.keys())
-        durations = list(results[thresholds[0]]['durations'].keys())
-
-        # Create header row
-        header = "Threshold"
-        for duration in durations:
-            header += f" | {duration} (All/+/-)"
-        f.write(f"{header}\n")
-        f.write("-" * len(header) + "\n")
-
-        # Create rows for each threshold
-        for threshold in thresholds:
-            row = f"{threshold}"
-            for duration in durations:
-                dur_data = results[threshold]['durations'][duration]
-                row += f" | {dur_data['count']} ({dur_data['pos_count']}/{dur_data['neg_count']})"
-            f.write(f"{row}\n")
-        f.write("\n")
-
-        # Detailed information about top events
-        f.write("TOP 5 EVENTS BY THRESHOLD (3h MINIMUM DURATION)\n")
-        f.write("--------------------------------------------\n")
-
-        for threshold in thresholds:
-            f.write(f"\n{threshold} THRESHOLD:\n")
-            events = results[threshold]['durations']['3h']['events_df']
+    # Collect the report text and write it in one call
+    lines = []
+    lines.append(f"STORM SURGE THRESHOLD ANALYSIS REPORT ({data_type} DATA)\n")
+    lines.append("=================================================\n\n")
 
-            if len(events) > 0:
-                # Show top 5 events or all if less than 5
-                top_events = events.head(min(5, len(events)))
-                for i, (_, event) in enumerate(top_events.iterrows(), 1):
-                    f.write(f"{i}. {event['Direction']} Surge on ")
-                    f.write(f"{event['Peak_Time'].strftime('%Y-%m-%d %H:%M')}\n")
-                    f.write(f"   Peak magnitude: {abs(event['Peak_Surge']):.4f} m\n")
-                    f.write(f"   Duration: {event['Duration_Hours']:.1f} hours\n")
-            else:
-                f.write("No events detected\n")
-
-        # Educational implications
-        f.write("\nEDUCATIONAL IMPLICATIONS\n")
-        f.write("------------------------\n")
-        f.write("1. Threshold Selection: The choice of threshold dramatically affects the number\n")
-        f.write("   of events identified. Lower thresholds detect more events but include less\n")
-        f.write("   significant ones, while higher thresholds focus only on the most extreme events.\n\n")
-
-        f.write("2. Duration Requirements: Requiring events to persist for longer periods filters\n")
-        f.write("   out noise and transient phenomena. This is particularly important for\n")
-        f.write("   distinguishing meteorologically-driven surges from other influences.\n\n")
-
-        f.write("3. Balance: The ideal threshold and duration settings depend on the specific\n")
-        f.write("   research or operational question being addressed. For educational purposes,\n")
-        f.write("   examining multiple thresholds provides insight into the spectrum of events.\n")
+    lines.append("THRESHOLD STATISTICS\n")
+    lines.append("-------------------\n")
+    lines.append(f"Mean: {surge_mean:.4f} m\n")
+    lines.append(f"Standard Deviation: {surge_std:.4f} m\n\n")
+
+    lines.append("THRESHOLD VALUES\n")
+    lines.append("---------------\n")
+    for threshold, data in results.items():
+        lines.append(f"{threshold}: ±{data['threshold_value']:.4f} m\n")
+    lines.append("\n")
+
+    # Event counts by threshold and duration
+    lines.append("EVENT COUNTS BY THRESHOLD AND MINIMUM DURATION\n")
+    lines.append("--------------------------------------------\n")
+
+    # Table header
+    thresholds = list(results.keys())
+    durations = list(results[thresholds[0]]['durations'].keys())
+
+    # Create header row
+    header = "Threshold" + "".join(f" | {duration} (All/+/-)" for duration in durations)
+    lines.append(f"{header}\n")
+    lines.append("-" * len(header) + "\n")
+
+    # Create rows for each threshold
+    for threshold in thresholds:
+        dur_data = [results[threshold]['durations'][duration] for duration in durations]
+        row = f"{threshold}" + "".join(f" | {d['count']} ({d['pos_count']}/{d['neg_count']})" for d in dur_data)
+        lines.append(f"{row}\n")
+    lines.append("\n")
+
+    # Detailed information about top events
+    lines.append("TOP 5 EVENTS BY THRESHOLD (3h MINIMUM DURATION)\n")
+    lines.append("--------------------------------------------\n")
+
+    for threshold in thresholds:
+        lines.append(f"\n{threshold} THRESHOLD:\n")
+        events = results[threshold]['durations']['3h']['events_df']
+
+        if len(events) > 0:
+            # Show top 5 events or all if less than 5
+            top_events = events.head(min(5, len(events)))
+            for i, (_, event) in enumerate(top_events.iterrows(), 1):
+                lines.append(f"{i}. {event['Direction']} Surge on ")
+                peak_time = pd.to_datetime(event['Peak_Time'], unit='s')
+                lines.append(f"{peak_time.strftime('%Y-%m-%d %H:%M')}\n")
+                lines.append(f"   Peak magnitude: {abs(event['Peak_Surge']):.4f} m\n")
+                lines.append(f"   Duration: {event['Duration_Hours']:.1f} hours\n")
+        else:
+            lines.append("No events detected\n")
+
+    # Educational implications
+    lines.append("\nEDUCATIONAL IMPLICATIONS\n")
+    lines.append("------------------------\n")
+    lines.append("1. Threshold Selection: The choice of threshold dramatically affects the number\n")
+    lines.append("   of events identified. Lower thresholds detect more events but include less\n")
+    lines.append("   significant ones, while higher thresholds focus only on the most extreme events.\n\n")
+
+    lines.append("2. Duration Requirements: Requiring events to persist for longer periods filters\n")
+    lines.append("   out noise and transient phenomena. This is particularly important for\n")
+    lines.append("   distinguishing meteorologically-driven surges from other influences.\n\n")
+
+    lines.append("3. Balance: The ideal threshold and duration settings depend on the specific\n")
+    lines.append("   research or operational question being addressed. For educational purposes,\n")
+    lines.append("   examining multiple thresholds provides insight into the spectrum of events.\n")
+
+    with open(report_file, 'w') as f:
+        f.write(''.join(lines))
 
     print(f"Threshold analysis report saved to {report_file}")
     return report_file
@@ -390,8 +527,11 @@ def compare_raw_vs_filtered(raw_results, filtered_results, raw_mean, raw_std, fi
     """Create comparison of how filtering affects event detection across thresholds"""
     print("Creating raw vs filtered comparison...")
 
+    # Start from an empty figure registry so earlier calls cannot slow this one down
+    plt.close('all')
+
     # Create comparison plot of event counts
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8))
 
     # Extract data for plotting
     thresholds = list(raw_results.keys())
@@ -426,50 +566,54 @@ def compare_raw_vs_filtered(raw_results, filtered_results, raw_mean, raw_std, fi
 
     plt.tight_layout()
     plt.savefig(f'{output_dir}/raw_vs_filtered_comparison.png', dpi=300)
-    plt.close()
+    plt.close(fig)
 
     # Create comparison table
     comparison_file = f'{output_dir}/raw_vs_filtered_comparison.txt'
 
-    with open(comparison_file, 'w') as f:
-        f.write("COMPARISON OF RAW VS FILTERED SURGE EVENT DETECTION\n")
-        f.write("================================================\n\n")
+    # Collect the report text and write it in one call
+    lines = []
+    lines.append("COMPARISON OF RAW VS FILTERED SURGE EVENT DETECTION\n")
+    lines.append("================================================\n\n")
 
-        f.write("BASIC STATISTICS\n")
-        f.write("--------------\n")
-        f.write(f"Raw Surge - Mean: {raw_mean:.4f} m, StdDev: {raw_std:.4f} m\n")
-        f.write(f"Filtered Surge - Mean: {filtered_mean:.4f} m, StdDev: {filtered_std:.4f} m\n\n")
+    lines.append("BASIC STATISTICS\n")
+    lines.append("--------------\n")
+    lines.append(f"Raw Surge - Mean: {raw_mean:.4f} m, StdDev: {raw_std:.4f} m\n")
+    lines.append(f"Filtered Surge - Mean: {filtered_mean:.4f} m, StdDev: {filtered_std:.4f} m\n\n")
 
-        f.write("EVENT COUNTS BY THRESHOLD (3h MINIMUM DURATION)\n")
-        f.write("-------------------------------------------\n")
+    lines.append("EVENT COUNTS BY THRESHOLD (3h MINIMUM DURATION)\n")
+    lines.append("-------------------------------------------\n")
 
-        # Table header
-        f.write("Threshold | Raw Events | Filtered Events | Difference | % Reduction\n")
-        f.write("---------|-----------|-----------------|-----------|-----------\n")
+    # Table header
+    lines.append("Threshold | Raw Events | Filtered Events | Difference | % Reduction\n")
+    lines.append("---------|-----------|-----------------|-----------|-----------\n")
 
-        # Table rows
-        for i, threshold in enumerate(thresholds):
-            raw_count = raw_results[threshold]['durations']['3h']['count']
-            filtered_count = filtered_results[threshold]['durations']['3h']['count']
-            difference = raw_count - filtered_count
-            pct_reduction = (difference / raw_count * 100) if raw_count > 0 else 0
+    # Table rows
+    for i, threshold in enumerate(thresholds):
+        raw_count = raw_results[threshold]['durations']['3h']['count']
+        filtered_count = filtered_results[threshold]['durations']['3h']['count']
+        difference = raw_count - filtered_count
+        pct_reduction = (difference / raw_count * 100) if raw_count > 0 else 0
 
-            f.write(f"{threshold} | {raw_count} | {filtered_count} | {difference} | {pct_reduction:.1f}%\n")
+        lines.append(f"{threshold} | {raw_count} | {filtered_count} | {difference} | {pct_reduction:.1f}%\n")
 
-        f.write("\nEDUCATIONAL IMPLICATIONS OF FILTERING\n")
-        f.write("----------------------------------\n")
-        f.write("1. Noise Reduction: Filtering removes high-frequency oscillations that may be\n")
-        f.write("   measurement noise or phenomena with timescales shorter than meteorological events.\n\n")
+    lines.append("\nEDUCATIONAL IMPLICATIONS OF FILTERING\n")
+    lines.append("----------------------------------\n")
+    lines.append("1. Noise Reduction: Filtering removes high-frequency oscillations that may be\n")
+    lines.append("   measurement noise or phenomena with timescales shorter than meteorological events.\n\n")
 
-        f.write("2. Event Consolidation: Multiple raw exceedances close in time often represent\n")
-        f.write("   a single meteorological event. Filtering consolidates these into a clearer signal.\n\n")
+    lines.append("2. Event Consolidation: Multiple raw exceedances close in time often represent\n")
+    lines.append("   a single meteorological event. Filtering consolidates these into a clearer signal.\n\n")
 
-        f.write("3. Threshold Selection: The appropriate threshold depends on whether you're using\n")
-        f.write("   raw or filtered data. Lower thresholds may be appropriate for filtered data\n")
-        f.write("   since noise has already been reduced.\n\n")
+    lines.append("3. Threshold Selection: The appropriate threshold depends on whether you're using\n")
+    lines.append("   raw or filtered data. Lower thresholds may be appropriate for filtered data\n")
+    lines.append("   since noise has already been reduced.\n\n")
 
-        f.write("4. Research vs. Operations: Research may benefit from examining both raw and filtered\n")
-        f.write("   data, while operational forecasting typically relies on filtered data for clarity.\n")
+    lines.append("4. Research vs. Operations: Research may benefit from examining both raw and filtered\n")
+    lines.append("   data, while operational forecasting typically relies on filtered data for clarity.\n")
+
+    with open(comparison_file, 'w') as f:
+        f.write(''.join(lines))
 
     print(f"Raw vs filtered comparison saved to {comparison_file}")
 
@@ -22,9 +22,25 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.metrics import r2_score
-from sklearn.linear_model import LinearRegression
+from scipy.linalg import cho_factor, cho_solve
+import functools
 import os
 
+# SSH loading and the Numba kernels are shared with the other scripts in this folder;
+# njit is None when Numba is not installed, and the design matrix is then built
+# with NumPy trig calls
+from tidal_helpers import njit, read_ssh_values
+if njit is not None:
+    from tidal_helpers import (fill_design_matrix, fill_design_matrix_at,
+                               goertzel_coefficients, streaming_r_squared)
+
+# PyArrow is optional; without it result tables are written with pandas' CSV writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 # Create output directory for saving results
 output_dir = './tidal_analysis_results'
 os.makedirs(output_dir, exist_ok=True)
@@ -34,21 +50,7 @@ def load_ssh_data(file_path, has_header=False):
     """Load sea surface height data from a CSV file"""
     print(f"Loading data from {file_path}...")
 
-    if has_header:
-        ssh_data = pd.read_csv(file_path)
-        ssh_values = ssh_data.iloc[:, 0].values
-    else:
-        ssh_data = pd.read_csv(file_path, header=None)
-        ssh_values = ssh_data.iloc[:, 0].values
-
-    # Handle potential missing or non-numeric data
-    ssh_values = pd.to_numeric(ssh_values, errors='coerce')
-    if np.isnan(ssh_values).any():
-        print("Data contains NaN values. Filling missing data using linear interpolation...")
-        ssh_values = pd.Series(ssh_values).interpolate(method='linear', limit_direction='both').values
-
-    # Ensure 'ssh_values' is a one-dimensional array
-    ssh_values = ssh_values.flatten()
+    ssh_values = read_ssh_values(file_path, has_header)
 
     print(f"Loaded {len(ssh_values)} data points.")
     return ssh_values
@@ -76,58 +78,184 @@ def define_tidal_constituents():
     print(f"Defined {len(constituents)} tidal constituents")
     return constituents
 
+# Return the spacing of an evenly spaced time vector, or None if it is uneven
+def uniform_time_step(t):
+    """Return t[1] - t[0] if every step of t is the same, otherwise None"""
+    if len(t) < 2:
+        return None
+    dt = t[1] - t[0]
+    return dt if np.all(np.diff(t) == dt) else None
+
 # Create the design matrix for linear regression
-def create_design_matrix(t, freqs):
+def create_design_matrix(t, freqs, dtype=np.float32):
     """
     Create a design matrix for tidal harmonic analysis
 
     For each constituent frequency, we need both sine and cosine terms to
     account for the amplitude and phase.
+
+    X is stored as float32 by default: the columns are bounded by 1 and
+    nearly orthogonal, so single precision is ample for the fit and halves
+    the memory traffic of building X and forming X'X and X'y. Phases are
+    still computed in float64, since they grow to thousands of radians.
     """
     print("Creating design matrix...")
-    X = np.zeros((len(t), 2 * len(freqs)))
-    for i, freq in enumerate(freqs):
-        # For each frequency, we need both cosine and sine terms
-        X[:, 2*i] = np.cos(2 * np.pi * freq * t)      # Cosine term
-        X[:, 2*i+1] = np.sin(2 * np.pi * freq * t)    # Sine term
+    # Columns alternate cosine/sine per constituent
+    X = np.empty((len(t), 2 * len(freqs)), dtype=dtype)
+
+    # Uniformly sampled data (the usual case) can use the trig-free recurrence
+    dt = uniform_time_step(t)
+    if njit is not None and dt is not None:
+        fill_design_matrix(X, np.asarray(freqs, dtype=np.float64), float(t[0]), float(dt))
+    elif njit is not None:
+        fill_design_matrix_at(X, np.asarray(t, dtype=np.float64), np.asarray(freqs, dtype=np.float64))
+    else:
+        # Phase of every constituent at every time step (N x K)
+        phase = (2 * np.pi) * t[:, None] * freqs[None, :]
+
+        # exp(i*phase) = cos(phase) + i*sin(phase), so one complex exponential
+        # gives both terms of every constituent
+        z = np.exp(1j * phase)
+        X[:, 0::2] = z.real    # Cosine terms
+        X[:, 1::2] = z.imag    # Sine terms
 
     print(f"Design matrix shape: {X.shape}")
     return X
 
-# Function to extract constituent information from model parameters
-def extract_constituent_info(params, constituent_names, frequencies):
-    """Extract amplitudes and phases from the model parameters"""
-    print("Extracting constituent information...")
+# Build the normal-equations matrix of the harmonic model
+def normal_matrix(X):
+    """
+    Return X'X augmented with the intercept row and column
 
-    # Parameters come in pairs (cosine, sine) for each constituent
-    cos_coeffs = params[0::2]  # Every even parameter (0, 2, 4...)
-    sin_coeffs = params[1::2]  # Every odd parameter (1, 3, 5...)
+    The intercept column of ones is never built; its entries in X'X are the
+    column sums of X and the sample count.
+    """
+    n_params = X.shape[1]
+    XtX = np.empty((n_params + 1, n_params + 1))
+    XtX[:n_params, :n_params] = X.T @ X
+    col_sums = X.sum(axis=0, dtype=np.float64)
+    XtX[:n_params, n_params] = col_sums
+    XtX[n_params, :n_params] = col_sums
+    XtX[n_params, n_params] = len(X)
+    return XtX
+
+# Design matrix and Cholesky factor, memoized per record length and constituent set
+@functools.lru_cache(maxsize=4)
+def harmonic_basis(n_samples, freqs):
+    """
+    Return the design matrix for t = 0..n_samples-1 and the Cholesky factor
+    of its augmented normal matrix
 
-    # Calculate amplitude and phase from cosine and sine coefficients
+    Both depend only on the record length and the constituent frequencies
+    (passed as a tuple so they can be hashed), so repeated analyses of
+    records of the same length reuse them and only need X'y and a
+    triangular solve. The cached arrays are made read-only.
+    """
+    X = create_design_matrix(np.arange(n_samples), np.array(freqs))
+    factor = cho_factor(normal_matrix(X))
+    X.setflags(write=False)
+    factor[0].setflags(write=False)
+    return X, factor
+
+# Fit the harmonic model by least squares
+def fit_harmonic_model(X, y, orthogonal=False, factor=None):
+    """
+    Fit y = X @ params + intercept by solving the normal equations
+
+    X has only 2K columns (plus the intercept), so (X'X) is a small, well
+    conditioned matrix for distinct tidal frequencies and a Cholesky solve
+    is all that is needed. A precomputed Cholesky factor of the augmented
+    normal matrix (see harmonic_basis) can be passed in as factor.
+
+    With orthogonal=True the sine/cosine columns are treated as exactly
+    orthogonal, which makes the fit a projection: params = (2/N) X'y and
+    intercept = mean(y). This skips X'X entirely but is only an
+    approximation; it is close when the record spans many beat periods of
+    neighbouring constituents (e.g. S2/K2 and K1/P1 need about half a year).
+    """
+    print("Fitting linear regression model...")
+    n_params = X.shape[1]
+
+    # Match y to X's precision so the products stay in single-precision BLAS
+    y_x = y.astype(X.dtype, copy=False)
+
+    if orthogonal:
+        return (2.0 / len(y)) * (X.T @ y_x).astype(np.float64), y.mean()
+
+    if factor is None:
+        factor = cho_factor(normal_matrix(X))
+    Xty = np.append(X.T @ y_x, y.sum())
+
+    beta = cho_solve(factor, Xty)
+    return beta[:n_params], beta[n_params]
+
+# Convert cosine/sine coefficient pairs into amplitude and phase
+def amplitude_and_phase(cos_coeffs, sin_coeffs):
+    """Return the amplitude and phase (degrees, 0-360) of each constituent"""
     amplitudes = np.sqrt(cos_coeffs**2 + sin_coeffs**2)
     phases = np.arctan2(sin_coeffs, cos_coeffs) * (180 / np.pi)  # Convert to degrees
     phases = np.mod(phases, 360)  # Adjust phase angles to be between 0 and 360 degrees
+    return amplitudes, phases
+
+if njit is not None:
+    # Compiled version of the function above: one pass, no intermediate arrays
+    @njit(cache=True)
+    def amplitude_and_phase(cos_coeffs, sin_coeffs):
+        n = len(cos_coeffs)
+        amplitudes = np.empty(n)
+        phases = np.empty(n)
+        for k in range(n):
+            c = cos_coeffs[k]
+            s = sin_coeffs[k]
+            amplitudes[k] = np.sqrt(c * c + s * s)
+            phases[k] = (np.arctan2(s, c) * (180 / np.pi)) % 360
+        return amplitudes, phases
+
+# Function to extract constituent information from model parameters
+def extract_constituent_info(cos_coeffs, sin_coeffs, constituent_names, frequencies):
+    """Extract amplitudes and phases from the cosine and sine coefficients"""
+    print("Extracting constituent information...")
+
+    # Calculate amplitude and phase from cosine and sine coefficients
+    amplitudes, phases = amplitude_and_phase(cos_coeffs, sin_coeffs)
+
+    # Order constituents by amplitude (descending) up front, so the
+    # dataframe is built once already sorted
+    order = np.argsort(-amplitudes, kind='stable')
+    frequencies = np.asarray(frequencies)[order]
 
     # Create a dataframe with results
     results_df = pd.DataFrame({
-        'Constituent': constituent_names,
+        'Constituent': [constituent_names[i] for i in order],
         'Frequency (cycles per hour)': frequencies,
         'Period (hours)': 1/frequencies,
-        'Amplitude': amplitudes,
-        'Phase (degrees)': phases,
-        'Cosine_coef': cos_coeffs,
-        'Sine_coef': sin_coeffs
+        'Amplitude': amplitudes[order],
+        'Phase (degrees)': phases[order],
+        'Cosine_coef': cos_coeffs[order],
+        'Sine_coef': sin_coeffs[order]
     })
 
-    # Sort the dataframe by amplitude in descending order
-    results_df = results_df.sort_values(by='Amplitude', ascending=False).reset_index(drop=True)
-
     print("Constituent information extracted")
     return results_df
 
+# Write a results table to CSV
+def write_csv(df, path):
+    """Write df to path without its index, using Arrow's C++ CSV writer when available"""
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False)
+
 # Main function to analyze tidal constituents
-def analyze_tidal_constituents(file_path, start_date='2022-01-01', has_header=False):
-    """Main function to determine tidal constituents from SSH data"""
+def analyze_tidal_constituents(file_path, start_date='2022-01-01', has_header=False, orthogonal=False):
+    """
+    Main function to determine tidal constituents from SSH data
+
+    With orthogonal=True the constituents are found by projection instead
+    of a full least-squares fit (see fit_harmonic_model); for evenly
+    sampled data and Numba this uses Goertzel's recurrence directly on the
+    series, without building a design matrix.
+    """
 
     print("\n= Step 1: Determining Tidal Constituents =\n")
 
@@ -142,55 +270,67 @@ def analyze_tidal_constituents(file_path, start_date='2022-01-01', has_header=Fa
     frequencies = np.array(list(constituents.values()))
     constituent_names = list(constituents.keys())
 
-    # Create design matrix
-    X = create_design_matrix(t, frequencies)
+    dt = uniform_time_step(t)
+    if orthogonal and njit is not None and dt is not None:
+        # Project onto each constituent with Goertzel's recurrence
+        X = None
+        cos_coeffs, sin_coeffs = goertzel_coefficients(ssh_values, frequencies, float(t[0]), float(dt))
+        intercept = ssh_values.mean()
+    else:
+        # Create design matrix (reused from earlier runs on records of the same length)
+        X, factor = harmonic_basis(len(t), tuple(frequencies))
 
-    # Fit linear regression model
-    print("Fitting linear regression model...")
-    linear_model = LinearRegression()
-    linear_model.fit(X, ssh_values)
+        # Fit linear regression model
+        params, intercept = fit_harmonic_model(X, ssh_values, orthogonal=orthogonal, factor=factor)
 
-    # Extract model parameters
-    params = linear_model.coef_
-    intercept = linear_model.intercept_
+        # Parameters come in pairs (cosine, sine) for each constituent; keep them
+        # as two contiguous arrays from here on rather than strided views
+        cos_coeffs = params[0::2].copy()  # Every even parameter (0, 2, 4...)
+        sin_coeffs = params[1::2].copy()  # Every odd parameter (1, 3, 5...)
 
     # Extract constituent information
-    results_df = extract_constituent_info(params, constituent_names, frequencies)
+    results_df = extract_constituent_info(cos_coeffs, sin_coeffs, constituent_names, frequencies)
 
     # Save results to files
     print("Saving results...")
-    results_df.to_csv(f'{output_dir}/tidal_constituents.csv', index=False)
+    write_csv(results_df, f'{output_dir}/tidal_constituents.csv')
 
     # Save model parameters for later use
-    np.savez(f'{output_dir}/model_parameters.npz',
-             params=params,
-             intercept=intercept,
-             frequencies=frequencies,
-             constituent_names=constituent_names)
+    np.savez_compressed(f'{output_dir}/model_parameters.npz',
+                        cos_coeffs=cos_coeffs,
+                        sin_coeffs=sin_coeffs,
+                        intercept=intercept,
+                        frequencies=frequencies,
+                        constituent_names=constituent_names)
 
     # Calculate basic model fit statistics
-    reconstructed_ssh = X.dot(params) + intercept
-    r_squared = r2_score(ssh_values, reconstructed_ssh)
+    if njit is not None and dt is not None:
+        r_squared = streaming_r_squared(ssh_values, cos_coeffs, sin_coeffs, float(intercept),
+                                        frequencies, float(t[0]), float(dt))
+    else:
+        reconstructed_ssh = X.dot(params) + intercept
+        r_squared = r2_score(ssh_values, reconstructed_ssh)
     print(f"R-squared of the model: {r_squared:.4f}")
 
-    # Plot the top constituents
-    plt.figure(figsize=(12, 6))
+    # Plot the top constituents; the chart is only saved, and the figure is
+    # closed right away so it does not stay in memory
+    fig, ax = plt.subplots(figsize=(12, 6))
     top_n = min(10, len(results_df))  # Show top 10 or all if less than 10
-    bars = plt.bar(results_df['Constituent'][:top_n], results_df['Amplitude'][:top_n], color='tab:blue', alpha=0.7)
+    bars = ax.bar(results_df['Constituent'][:top_n], results_df['Amplitude'][:top_n], color='tab:blue', alpha=0.7)
 
     # Add amplitude values on top of bars
     for bar in bars:
         height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+        ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
                 f'{height:.3f}', ha='center', va='bottom', rotation=0)
 
-    plt.xlabel('Tidal Constituent')
-    plt.ylabel('Amplitude (m)')
-    plt.title('Top Tidal Constituents by Amplitude')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/top_constituents.png', dpi=300)
-    plt.show()
+    ax.set_xlabel('Tidal Constituent')
+    ax.set_ylabel('Amplitude (m)')
+    ax.set_title('Top Tidal Constituents by Amplitude')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/top_constituents.png', dpi=300)
+    plt.close(fig)
 
     # Print the top constituents
     print("\nTop 5 Tidal Constituents:")
@@ -199,12 +339,12 @@ def analyze_tidal_constituents(file_path, start_date='2022-01-01', has_header=Fa
     print(f"\nAll tidal constituent data saved to {output_dir}/tidal_constituents.csv")
     print(f"Model parameters saved to {output_dir}/model_parameters.npz")
 
-    return results_df, params, intercept
+    return results_df, cos_coeffs, sin_coeffs, intercept
 
 # Execute the analysis
 if __name__ == "__main__":
     file_path = 'adjusted_data (3).csv'  # Adjust this path to your data file
-    results_df, params, intercept = analyze_tidal_constituents(file_path)
+    results_df, cos_coeffs, sin_coeffs, intercept = analyze_tidal_constituents(file_path)
 
     print("\n==== EDUCATIONAL NOTES ====")
     print("Tidal constituent analysis is based on the fact that tides are caused by a combination")
@@ -0,0 +1,163 @@
+"""
+# Shared helpers for the tidal analysis scripts
+# =============================================
+#
+# Loading of the SSH series and the Numba kernels used by the harmonic fit,
+# kept in one place so every script in this folder uses the same code.
+"""
+
+import numpy as np
+
+# Numba is optional; without it the scripts fall back to plain NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Parse a single SSH value from the CSV
+def parse_ssh_token(token):
+    """Convert one CSV token to float, treating non-numeric entries as NaN"""
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+# Read the SSH column of a CSV file and fill any gaps
+def read_ssh_values(file_path, has_header=False):
+    """
+    Return the first column of file_path as a 1-D float array with missing
+    or non-numeric entries filled by linear interpolation
+
+    Raises ValueError if the column has no numeric values at all, since
+    there is nothing to interpolate from.
+    """
+    # Read the first column straight into a float array; only fall back to the
+    # slower per-token parser if the file contains non-numeric entries
+    loadtxt_kwargs = dict(dtype=np.float64, delimiter=',', usecols=0, ndmin=1,
+                          skiprows=1 if has_header else 0)
+    try:
+        ssh_values = np.loadtxt(file_path, **loadtxt_kwargs)
+    except ValueError:
+        # Handle potential missing or non-numeric data
+        ssh_values = np.loadtxt(file_path, converters=parse_ssh_token, **loadtxt_kwargs)
+
+    valid = ~np.isnan(ssh_values)
+    if not valid.all():
+        if not valid.any():
+            raise ValueError(f"{file_path} contains no numeric SSH values")
+        print("Data contains NaN values. Filling missing data using linear interpolation...")
+        # Linear interpolation over the sample index; valid samples are returned
+        # unchanged and leading/trailing gaps take the nearest valid value
+        idx = np.arange(len(ssh_values))
+        ssh_values = np.interp(idx, idx[valid], ssh_values[valid])
+
+    # Ensure 'ssh_values' is a one-dimensional array
+    return ssh_values.flatten()
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def fill_design_matrix(X, freqs, t0, dt):
+        """
+        Fill the cosine/sine columns of X for uniformly spaced times t0 + n*dt
+
+        Instead of evaluating cos/sin at every sample, each constituent's
+        (cos, sin) pair is rotated forward by one time step using the
+        angle-addition formulas, so the inner loop is only multiplies and adds.
+        """
+        for k in prange(len(freqs)):
+            step = 2 * np.pi * freqs[k] * dt
+            cos_step = np.cos(step)
+            sin_step = np.sin(step)
+            c = np.cos(2 * np.pi * freqs[k] * t0)
+            s = np.sin(2 * np.pi * freqs[k] * t0)
+            for n in range(X.shape[0]):
+                X[n, 2*k] = c
+                X[n, 2*k+1] = s
+                c, s = c * cos_step - s * sin_step, s * cos_step + c * sin_step
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def fill_design_matrix_at(X, t, freqs):
+        """
+        Fill the cosine/sine columns of X for arbitrary (e.g. uneven) times t
+
+        cos and sin of the same angle are evaluated next to each other, which
+        lets LLVM fuse them into a single sincos call per sample.
+        """
+        for n in prange(X.shape[0]):
+            for k in range(len(freqs)):
+                angle = 2 * np.pi * freqs[k] * t[n]
+                X[n, 2*k] = np.cos(angle)
+                X[n, 2*k+1] = np.sin(angle)
+
+    @njit(parallel=True, cache=True)
+    def goertzel_coefficients(y, freqs, t0, dt):
+        """
+        Project y onto the cosine and sine of each frequency, (2/N) X'y, for
+        uniformly spaced times t0 + n*dt
+
+        Goertzel's recurrence evaluates the DFT of y at an arbitrary frequency
+        with one multiply and two adds per sample and no trig calls in the
+        loop; the result is then rotated back to the phase reference at t0.
+        """
+        n = len(y)
+        cos_coeffs = np.empty(len(freqs))
+        sin_coeffs = np.empty(len(freqs))
+        for k in prange(len(freqs)):
+            w = 2 * np.pi * freqs[k] * dt
+            coeff = 2 * np.cos(w)
+            s1 = 0.0
+            s2 = 0.0
+            for i in range(n):
+                s0 = y[i] + coeff * s1 - s2
+                s2 = s1
+                s1 = s0
+            # sum_i y[i] * exp(-1j*w*i) = exp(-1j*w*(n-1)) * (s1 - exp(-1j*w) * s2)
+            re = s1 - s2 * np.cos(w)
+            im = s2 * np.sin(w)
+            rot = -(w * (n - 1) + 2 * np.pi * freqs[k] * t0)
+            cos_coeffs[k] = (2.0 / n) * (re * np.cos(rot) - im * np.sin(rot))
+            sin_coeffs[k] = -(2.0 / n) * (re * np.sin(rot) + im * np.cos(rot))
+        return cos_coeffs, sin_coeffs
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def streaming_r_squared(y, cos_coeffs, sin_coeffs, intercept, freqs, t0, dt):
+        """
+        R-squared of the harmonic model for uniformly spaced times t0 + n*dt
+
+        The prediction is rebuilt sample by sample with the same rotation
+        recurrence as fill_design_matrix, so no design matrix or prediction
+        array is needed. Samples are processed in blocks in parallel; each
+        block starts from exact cos/sin values, which also bounds rounding drift.
+        """
+        n = len(y)
+        n_freqs = len(freqs)
+        y_mean = y.mean()
+        block_size = 4096
+        n_blocks = (n + block_size - 1) // block_size
+        ss_res = np.zeros(n_blocks)
+        ss_tot = np.zeros(n_blocks)
+
+        for b in prange(n_blocks):
+            start = b * block_size
+            stop = min(start + block_size, n)
+
+            c = np.empty(n_freqs)
+            s = np.empty(n_freqs)
+            cos_step = np.empty(n_freqs)
+            sin_step = np.empty(n_freqs)
+            for k in range(n_freqs):
+                phase0 = 2 * np.pi * freqs[k] * (t0 + start * dt)
+                c[k] = np.cos(phase0)
+                s[k] = np.sin(phase0)
+                cos_step[k] = np.cos(2 * np.pi * freqs[k] * dt)
+                sin_step[k] = np.sin(2 * np.pi * freqs[k] * dt)
+
+            for i in range(start, stop):
+                y_hat = intercept
+                for k in range(n_freqs):
+                    y_hat += cos_coeffs[k] * c[k] + sin_coeffs[k] * s[k]
+                    c[k], s[k] = c[k] * cos_step[k] - s[k] * sin_step[k], s[k] * cos_step[k] + c[k] * sin_step[k]
+                ss_res[b] += (y[i] - y_hat) ** 2
+                ss_tot[b] += (y[i] - y_mean) ** 2
+
+        return 1 - ss_res.sum() / ss_tot.sum()
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import random
 
 # Define months
 months = [
@@ -9,20 +8,10 @@ months = [
 ]
 
 # Valentia Observatory data (baseline)
-valentia_wind_speeds = [
+valentia_wind_speeds = np.array([
     9.2, 8.7, 8.1, 6.5, 6.0, 5.7,
     5.5, 5.8, 6.9, 7.8, 8.5, 9.0
-]
-
-# Create Valentia Observatory dataset
-valentia_df = pd.DataFrame({
-    'Month': months,
-    'Wind Speed (m/s)': valentia_wind_speeds
-})
-
-# Save Valentia data
-valentia_df.to_excel('Valentia_Observatory_Wind_2024.xlsx', index=False)
-print("Created Valentia Observatory dataset")
+])
 
 # Define offshore locations around Ireland
 locations = [
@@ -38,7 +27,7 @@ locations = [
 
 # Wind speed adjustment factors relative to Valentia
 # Based on general Irish wind patterns where west/northwest tends to be windier
-location_factors = [
+location_factors = np.array([
     0.85,  # Dublin Bay - less windy than west coast
     0.95,  # Cork Harbour
     1.05,  # Shannon Estuary - slightly windier
@@ -47,28 +36,36 @@ location_factors = [
     0.90,  # Irish Sea
     1.00,  # Celtic Sea
     1.20   # Atlantic Coast - most exposed to Atlantic winds
-]
-
-# Generate artificial datasets for each location
-for i, location in enumerate(locations):
-    wind_speeds = []
+])
 
-    # Create monthly wind speeds with realistic variations
-    for j in range(len(months)):
-        # Apply location factor plus small random variation (±10%)
-        random_variation = 0.9 + (random.random() * 0.2)
-        wind_speed = valentia_wind_speeds[j] * location_factors[i] * random_variation
-        wind_speeds.append(round(wind_speed, 1))
-
-    # Create DataFrame
+# Write one location's monthly wind speeds to CSV
+def write_location(location, wind_speeds):
+    """Save the 12 monthly wind speeds for a location as <Location>_Wind_2024.csv"""
     df = pd.DataFrame({
         'Month': months,
         'Wind Speed (m/s)': wind_speeds
     })
 
-    # Save to Excel file
-    filename = f"{location.replace(' ', '_').replace('(', '').replace(')', '')}_Wind_2024.xlsx"
-    df.to_excel(filename, index=False)
+    # Save to CSV file (12 rows each, so building an Excel workbook per file is mostly overhead)
+    filename = f"{location.replace(' ', '_').replace('(', '').replace(')', '')}_Wind_2024.csv"
+    df.to_csv(filename, index=False)
     print(f"Created dataset for {location}")
 
-print("\nAll datasets created successfully!")
+if __name__ == "__main__":
+    # Save Valentia Observatory data
+    write_location("Valentia Observatory", valentia_wind_speeds)
+
+    # Create monthly wind speeds for every location at once:
+    # Valentia baseline x location factor x small random variation (±10%)
+    rng = np.random.default_rng(42)  # Fixed seed so the generated datasets are reproducible
+    random_variation = rng.uniform(0.9, 1.1, size=(len(locations), len(months)))
+    all_wind_speeds = np.round(
+        location_factors[:, None] * valentia_wind_speeds * random_variation, 1
+    )
+
+    # Generate artificial datasets for each location; each file is only a few
+    # hundred bytes, so writing them in turn is faster than a process pool
+    for location, wind_speeds in zip(locations, all_wind_speeds):
+        write_location(location, wind_speeds)
+
+    print("\nAll datasets created successfully!")
@@ -1,46 +1,250 @@
-import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved as PNG files, never shown
 import matplotlib.pyplot as plt
 import random
+import bisect
+import functools
+import importlib.util
 import os
+import sys
 import time
+import zlib
 from matplotlib.colors import LinearSegmentedColormap
 from datetime import datetime
+from operator import itemgetter
+
+# PyArrow is optional; with it, Excel wind files are cached as Parquet after the first read.
+# Only check that it is installed here - pandas imports it when a Parquet file is used.
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
 
 answer = None
 score = 0
 
+# Wind data file endings, in order of preference (CSV from the current generator,
+# Excel from older versions of it)
+WIND_FILE_SUFFIXES = ('_Wind_2024.csv', '_Wind_2024.xlsx')
+
+# Seasons with their corresponding months, and the reverse lookup
+SEASONS = {
+    'Winter': ['December', 'January', 'February'],
+    'Spring': ['March', 'April', 'May'],
+    'Summer': ['June', 'July', 'August'],
+    'Autumn': ['September', 'October', 'November']
+}
+MONTH_TO_SEASON = {month: season for season, season_months in SEASONS.items() for month in season_months}
+
+# Colormap for the monthly power bars that goes from blue to green to yellow to red
+WIND_CMAP = LinearSegmentedColormap.from_list("wind_colors", [
+    "#4575b4", "#74add1", "#abd9e9", "#e0f3f8",
+    "#fee090", "#fdae61", "#f46d43", "#d73027"
+])
+# RGBA colors of the 12 monthly bars, sampled from the colormap once
+POWER_BAR_COLORS = WIND_CMAP(np.linspace(0, 1, 12))
+
+# Visually distinct colors for the seasons - Blue, Green, Orange, Brown
+SEASON_COLORS = ['#4575b4', '#74c476', '#fd8d3c', '#8c564b']
+
+# Detective ranks and the scores at which each rank after the first is reached
+RANK_THRESHOLDS = (20, 50, 80)
+RANK_NAMES = ("Beginner Wind Detective", "Wind Detective",
+              "Senior Wind Detective", "Master Wind Detective")
+
+# Follow-up analyses offered after each location's main investigation
+ANALYSIS_OPTIONS = (
+    "Seasonal wind patterns",
+    "Wind direction analysis",
+    "Environmental impact assessment",
+    "Economic feasibility study",
+    "Continue to next location"
+)
+
+# ANSI "clear screen, cursor home" sequence; Windows consoles still use cls
+CLEAR_SEQUENCE = '\x1b[2J\x1b[H' if os.name != 'nt' else None
+
+# Chart PNGs are for on-screen viewing: screen resolution, opaque white
+# background and fast, light zlib compression
+SAVEFIG_KWARGS = dict(dpi=72, facecolor='white', transparent=False,
+                      metadata={'Software': None}, pil_kwargs={'compress_level': 1})
+
+# One figure per chart type, reused for every location (see reuse_figure)
+PLOT_FIGURES = {}
+
+# Wind rose directions and typical direction weights by coast (see classify_location);
+# these give realistic patterns with clear dominant directions
+ROSE_DIRECTIONS = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
+ROSE_WEIGHTS = {
+    # East coast - predominantly westerly winds with SW secondary
+    'East': np.array([0.05, 0.07, 0.10, 0.08, 0.12, 0.18, 0.25, 0.15]),
+    # West coast - strong SW winds typical of Atlantic exposure
+    'West': np.array([0.08, 0.05, 0.04, 0.07, 0.15, 0.30, 0.20, 0.11]),
+    # South coast - SW predominant with westerly secondary
+    'South': np.array([0.06, 0.08, 0.10, 0.12, 0.09, 0.25, 0.20, 0.10]),
+    # North coast - SW and W winds with stronger northerly component
+    'North': np.array([0.15, 0.08, 0.06, 0.05, 0.07, 0.20, 0.26, 0.13]),
+    # Default - typical Irish pattern with SW predominance
+    'Default': np.array([0.08, 0.07, 0.08, 0.09, 0.12, 0.25, 0.20, 0.11]),
+}
+
+
+def detective_rank_for(score):
+    """Return the detective rank earned with a given score"""
+    return RANK_NAMES[bisect.bisect_right(RANK_THRESHOLDS, score)]
 
 def clear_screen():
     """Clear the console screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def print_slow(text, delay=0.03):
-    """Print text with a typing effect"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
+    if CLEAR_SEQUENCE:
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+def print_slow(text, delay=0.03, chunk_size=4):
+    """
+    Print text with a typing effect
+
+    Characters are written a few at a time (one write and flush per chunk).
+    When output is not a terminal, or FAST_MODE is set in the environment,
+    the text is printed immediately.
+    """
+    if not sys.stdout.isatty() or os.environ.get('FAST_MODE'):
+        print(text)
+        return
+    for i in range(0, len(text), chunk_size):
+        sys.stdout.write(text[i:i + chunk_size])
+        sys.stdout.flush()
+        time.sleep(delay * chunk_size)
     print()
 
+@functools.lru_cache(maxsize=None)
+def scan_wind_data_files(directory='.'):
+    """Scan a directory once for wind data files, keeping the preferred file per location"""
+    files_by_location = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            for preference, suffix in enumerate(WIND_FILE_SUFFIXES):
+                if entry.name.endswith(suffix) and entry.is_file():
+                    location = entry.name[:-len(suffix)]
+                    if location not in files_by_location or preference < files_by_location[location][0]:
+                        files_by_location[location] = (preference, entry.name)
+                    break
+    return tuple(name for _, (_, name) in sorted(files_by_location.items()))
+
+def prompt_int(prompt, low, high):
+    """Ask until the player enters a whole number from low to high"""
+    while True:
+        reply = input(prompt).strip()
+        if reply.isdecimal():
+            value = int(reply)
+            if low <= value <= high:
+                return value
+        print(f"Please enter a number between {low} and {high}!")
+
+def find_wind_data_files():
+    """Return one wind data file per location, preferring CSV over Excel"""
+    # A fresh list each time, since the game shuffles and pops from it
+    return list(scan_wind_data_files())
+
+def location_name_from_file(file_name):
+    """Turn a wind data file name into a readable location name"""
+    for suffix in WIND_FILE_SUFFIXES:
+        if file_name.endswith(suffix):
+            file_name = file_name[:-len(suffix)]
+            break
+    return file_name.replace('_', ' ')
+
+def cached_parquet(xlsx_path):
+    """Return a Parquet copy of an Excel wind file, converting it if missing or out of date"""
+    import pandas as pd
+
+    parquet_path = xlsx_path[:-len('.xlsx')] + '.parquet'
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(xlsx_path):
+        pd.read_excel(xlsx_path).to_parquet(parquet_path, index=False)
+    return parquet_path
+
+def load_wind_data(file_name):
+    """Load a location's monthly wind data from CSV or Excel"""
+    # pandas is imported on first use rather than at startup, so the intro and
+    # training sections are not held up by it
+    import pandas as pd
+
+    if file_name.endswith('.csv'):
+        return pd.read_csv(file_name)
+    if HAS_PYARROW:
+        return pd.read_parquet(cached_parquet(file_name))
+    return pd.read_excel(file_name)
+
+def compute_power_kW(wind_speeds, turbine_diameter=100, rho=1.225):
+    """Wind power (kW) through a turbine's swept area, 0.5 * rho * A * v^3, for each speed"""
+    v = np.asarray(wind_speeds, dtype=np.float64)
+    A = (np.pi * turbine_diameter**2) / 4  # Swept area (m²)
+    return 0.5 * rho * A * v**3 / 1000  # Convert to kilowatts
+
+def reuse_figure(name, figsize, polar=False):
+    """Return the cleared figure and axes for a chart type, creating them on first use"""
+    if name not in PLOT_FIGURES:
+        fig = plt.figure(figsize=figsize)
+        PLOT_FIGURES[name] = (fig, fig.add_subplot(111, polar=polar))
+    fig, ax = PLOT_FIGURES[name]
+
+    # Remove the previous location's drawing, including figure-level text boxes
+    ax.clear()
+    for text in list(fig.texts):
+        text.remove()
+
+    # Make it the current figure/axes so the plt.* calls below draw into it
+    plt.sca(ax)
+    return fig, ax
+
+def summarize_location(file_name):
+    """Load a location's wind data and compute its summary statistics"""
+    data = load_wind_data(file_name)
+    months = data['Month']
+    wind_speeds = data['Wind Speed (m/s)']
+
+    # Calculate key stats on the raw array (one argmax/argmin scan gives both the month and the value)
+    speeds = wind_speeds.to_numpy(dtype=np.float64)
+    max_idx = int(np.argmax(speeds))
+    min_idx = int(np.argmin(speeds))
+
+    # Calculate wind power for every month at once
+    wind_power_kW = compute_power_kW(speeds)
+    avg_power = wind_power_kW.mean()
+
+    # Calculate annual energy
+    annual_energy_MWh = (avg_power * 8760) / 1000  # 8760 hours in a year
+    avg_wind_speed = speeds.mean()
+
+    return {
+        'name': location_name_from_file(file_name),
+        'file': file_name,
+        'months': months,
+        'wind_speeds': wind_speeds,
+        'wind_power_kW': wind_power_kW,
+        'avg_wind_speed': avg_wind_speed,
+        'max_wind_speed': speeds[max_idx],
+        'min_wind_speed': speeds[min_idx],
+        'max_month': months.iat[max_idx],
+        'min_month': months.iat[min_idx],
+        'wind_speed_variance': np.var(speeds),
+        'avg_power': avg_power,
+        'annual_energy_MWh': annual_energy_MWh,
+        'homes_powered': int(annual_energy_MWh / 4.2),  # Average Irish home uses ~4.2 MWh/year
+        # Is this site suitable? (offshore sites should have avg wind speed >= 7.0 m/s)
+        'is_suitable': avg_wind_speed >= 7.0
+    }
+
 def create_power_plot(months, wind_speeds, wind_power_kW, avg_wind_speed, avg_power, annual_energy_MWh, homes_powered, location_name):
     """Create and save a colorful power plot for the location"""
     # Create colorful power plot
-    plt.figure(figsize=(10, 6))
-
-    # Create a colormap that goes from blue to green to yellow to red
-    colors = ["#4575b4", "#74add1", "#abd9e9", "#e0f3f8",
-              "#fee090", "#fdae61", "#f46d43", "#d73027"]
-    cmap = LinearSegmentedColormap.from_list("wind_colors", colors)
+    fig, ax = reuse_figure('power', figsize=(10, 6))
 
     # Plot with colorful bars
-    bars = plt.bar(range(1, 13), wind_power_kW, color=cmap(np.linspace(0, 1, 12)))
+    bars = plt.bar(range(1, 13), wind_power_kW, color=POWER_BAR_COLORS)
     plt.xticks(range(1, 13), labels=months, rotation=45)
 
     # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 20,
-                 f'{height:.0f}', ha='center', va='bottom')
+    ax.bar_label(bars, fmt='%.0f', padding=3)
 
     plt.grid(True, linestyle='--', alpha=0.7)
     plt.xlabel('Month', fontsize=12)
@@ -63,72 +267,55 @@ def create_power_plot(months, wind_speeds, wind_power_kW, avg_wind_speed, avg_po
     # Save the plot
     clean_name = location_name.replace(' ', '_')
     output_file = f"{clean_name}_power_analysis.png"
-    plt.savefig(output_file)
-    plt.close()
+    fig.savefig(output_file, **SAVEFIG_KWARGS)
 
     return output_file
 
+@functools.lru_cache(maxsize=8)
+def season_indices(months):
+    """Map each season to the positions of its months in a tuple of month names"""
+    return {season: np.array([i for i, month in enumerate(months) if MONTH_TO_SEASON.get(month) == season], dtype=np.intp)
+            for season in SEASONS}
+
 def create_seasonal_analysis(months, wind_speeds, location_name):
     """Create a seasonal analysis chart for the location"""
-    plt.figure(figsize=(10, 6))
-
-    # Define seasons with their corresponding months
-    seasons = {
-        'Winter': ['December', 'January', 'February'],
-        'Spring': ['March', 'April', 'May'],
-        'Summer': ['June', 'July', 'August'],
-        'Autumn': ['September', 'October', 'November']
-    }
+    fig, ax = reuse_figure('seasonal', figsize=(10, 6))
 
-    # Calculate seasonal averages - improved matching
-    seasonal_avg = {}
-    for season, season_months in seasons.items():
-        # Get indices of months belonging to this season
-        season_values = []
-        for i, month in enumerate(months):
-            # Check if the month belongs to this season (more robust matching)
-            if month in season_months:
-                season_values.append(wind_speeds[i])
-
-        # Calculate average if we have values
-        if season_values:
-            seasonal_avg[season] = sum(season_values) / len(season_values)
-        else:
-            seasonal_avg[season] = 0
+    # Calculate seasonal averages by indexing the speeds with each season's month
+    # positions (looked up once per month ordering, normally January..December)
+    speeds = np.asarray(wind_speeds, dtype=np.float64)
+    seasonal_avg = {season: float(speeds[idx].mean()) if len(idx) else 0
+                    for season, idx in season_indices(tuple(months)).items()}
 
     # Plot seasonal data
     seasons_list = list(seasonal_avg.keys())
     speeds_list = list(seasonal_avg.values())
 
-    # Create a colormap for seasons - visually distinct colors
-    season_colors = ['#4575b4', '#74c476', '#fd8d3c', '#8c564b']  # Blue, Green, Orange, Brown
-
-    bars = plt.bar(seasons_list, speeds_list, color=season_colors, width=0.6)
+    bars = plt.bar(seasons_list, speeds_list, color=SEASON_COLORS, width=0.6)
 
     # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.1f}', ha='center', va='bottom', fontsize=12)
+    ax.bar_label(bars, fmt='%.1f', padding=3, fontsize=12)
 
     plt.grid(True, linestyle='--', alpha=0.5, axis='y')
     plt.ylabel('Average Wind Speed (m/s)', fontsize=12)
     plt.title(f'Seasonal Wind Analysis - {location_name}', fontsize=14)
 
     # Add annotations
-    best_season = seasons_list[speeds_list.index(max(speeds_list))]
-    worst_season = seasons_list[speeds_list.index(min(speeds_list))]
+    best_idx = int(np.argmax(speeds_list))
+    worst_idx = int(np.argmin(speeds_list))
+    best_season, best_speed = seasons_list[best_idx], speeds_list[best_idx]
+    worst_season, worst_speed = seasons_list[worst_idx], speeds_list[worst_idx]
 
     # Calculate how much stronger the best season is compared to the worst
-    percent_stronger = ((max(speeds_list) - min(speeds_list)) / min(speeds_list)) * 100 if min(speeds_list) > 0 else 0
+    percent_stronger = ((best_speed - worst_speed) / worst_speed) * 100 if worst_speed > 0 else 0
 
     # Add variance calculation to show consistency
     variance = np.var(speeds_list)
     consistency = "Very consistent" if variance < 0.5 else "Moderately consistent" if variance < 1.5 else "Highly variable"
 
     plt.figtext(0.5, 0.01,
-                f"Best season: {best_season} ({max(speeds_list):.1f} m/s)\n"
-                f"Worst season: {worst_season} ({min(speeds_list):.1f} m/s)\n"
+                f"Best season: {best_season} ({best_speed:.1f} m/s)\n"
+                f"Worst season: {worst_season} ({worst_speed:.1f} m/s)\n"
                 f"{best_season} is {percent_stronger:.1f}% stronger than {worst_season}\n"
                 f"Seasonal consistency: {consistency} (variance: {variance:.2f})",
                 ha='center', bbox=dict(facecolor='white', alpha=0.8), fontsize=12)
@@ -139,57 +326,60 @@ def create_seasonal_analysis(months, wind_speeds, location_name):
     # Save the plot
     clean_name = location_name.replace(' ', '_')
     output_file = f"{clean_name}_seasonal_analysis.png"
-    plt.savefig(output_file)
-    plt.close()
+    fig.savefig(output_file, **SAVEFIG_KWARGS)
 
     return output_file, best_season, worst_season, seasonal_avg
 
+@functools.lru_cache(maxsize=64)
+def classify_location(location_name):
+    """
+    Classify a location from its name as (coast, site)
+
+    coast keys ROSE_WEIGHTS (from the compass point in the name) and site
+    keys SITE_ECONOMICS. Each location is classified once and reused by the
+    wind rose and the economic analysis.
+    """
+    coast = next((c for c in ('East', 'West', 'South', 'North') if c in location_name), 'Default')
+
+    if "Atlantic" in location_name:
+        site = 'Atlantic'
+    elif "Ocean" in location_name or "Sea" in location_name:
+        site = 'Offshore'
+    elif "Bay" in location_name:
+        site = 'Bay'
+    else:
+        site = 'Default'
+
+    return coast, site
+
 def create_wind_rose(wind_speeds, location_name):
     """Create a more realistic wind rose diagram based on location"""
-    plt.figure(figsize=(8, 8))
+    fig, ax = reuse_figure('wind_rose', figsize=(8, 8), polar=True)
 
     # Directions for the wind rose
-    directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-
-    # Create more meaningful direction weights based on location
-    # These are now more realistic with clearer dominant directions
-    if "East" in location_name:
-        # East coast - predominantly westerly winds with SW secondary
-        weights = [0.05, 0.07, 0.10, 0.08, 0.12, 0.18, 0.25, 0.15]
-    elif "West" in location_name:
-        # West coast - strong SW winds typical of Atlantic exposure
-        weights = [0.08, 0.05, 0.04, 0.07, 0.15, 0.30, 0.20, 0.11]
-    elif "South" in location_name:
-        # South coast - SW predominant with westerly secondary
-        weights = [0.06, 0.08, 0.10, 0.12, 0.09, 0.25, 0.20, 0.10]
-    elif "North" in location_name:
-        # North coast - SW and W winds with stronger northerly component
-        weights = [0.15, 0.08, 0.06, 0.05, 0.07, 0.20, 0.26, 0.13]
-    else:
-        # Default - typical Irish pattern with SW predominance
-        weights = [0.08, 0.07, 0.08, 0.09, 0.12, 0.25, 0.20, 0.11]
+    directions = ROSE_DIRECTIONS
 
     # Add random variation to make each location unique but consistent
-    # Use location name as seed for reproducibility
-    random.seed(sum(ord(c) for c in location_name))
-    weights = [w * random.uniform(0.85, 1.15) for w in weights]
+    # Use a CRC of the location name as seed for reproducibility (a local
+    # generator, so the global random state is left alone)
+    rng = np.random.default_rng(zlib.crc32(location_name.encode('utf-8')))
+    weights = ROSE_WEIGHTS[classify_location(location_name)[0]] * rng.uniform(0.85, 1.15, size=len(directions))
 
     # Normalize to ensure weights sum to 1
-    weights = [w / sum(weights) for w in weights]
+    weights /= weights.sum()
 
     # Scale wind speeds by the weights and apply a multiplier for visual impact
     avg_speed = np.mean(wind_speeds)
-    speeds = [avg_speed * w * 10 for w in weights]
+    speeds = avg_speed * weights * 10
 
     # Plot the wind rose
     angles = np.linspace(0, 2*np.pi, len(directions), endpoint=False)
 
     # Close the plot by repeating the first point
-    speeds.append(speeds[0])
+    speeds = np.append(speeds, speeds[0])
     angles = np.append(angles, angles[0])
 
     # Create the polar plot
-    ax = plt.subplot(111, polar=True)
     ax.plot(angles, speeds, 'o-', linewidth=2, color='#4682B4')
     ax.fill(angles, speeds, alpha=0.25, color='#4682B4')
 
@@ -201,7 +391,7 @@ def create_wind_rose(wind_speeds, location_name):
     ax.grid(True)
 
     # Calculate dominant direction and its percentage
-    dominant_idx = weights.index(max(weights))
+    dominant_idx = int(np.argmax(weights))
     dominant_direction = directions[dominant_idx]
     dominant_percent = weights[dominant_idx] * 100
 
@@ -211,13 +401,12 @@ def create_wind_rose(wind_speeds, location_name):
     # Save the wind rose
     clean_name = location_name.replace(' ', '_')
     output_file = f"{clean_name}_wind_rose.png"
-    plt.savefig(output_file)
-    plt.close()
+    fig.savefig(output_file, **SAVEFIG_KWARGS)
 
     # Calculate secondary direction (second highest)
     weights_copy = weights.copy()
     weights_copy[dominant_idx] = 0  # Remove dominant
-    secondary_idx = weights_copy.index(max(weights_copy))
+    secondary_idx = int(np.argmax(weights_copy))
     secondary_direction = directions[secondary_idx]
 
     # Additional analysis text
@@ -231,8 +420,13 @@ def create_wind_rose(wind_speeds, location_name):
 
     return output_file, dominant_direction, direction_analysis
 
-def calculate_carbon_savings(annual_energy_MWh):
-    """Calculate carbon savings from wind energy"""
+def carbon_savings_core(annual_energy_MWh):
+    """
+    Carbon figures for one location's annual energy yield (MWh)
+
+    Returns (co2_savings_tons, equivalent_trees, cars_equivalent,
+    homes_powered, percent_of_country).
+    """
     # Average CO2 emissions from fossil fuel electricity in Ireland
     # (in kg CO2 per MWh)
     fossil_emissions = 450
@@ -257,41 +451,40 @@ def calculate_carbon_savings(annual_energy_MWh):
     # Ireland has about 1.7 million households
     percent_of_country = (homes_powered / 1700000) * 100
 
+    return co2_savings_tons, equivalent_trees, cars_equivalent, homes_powered, percent_of_country
+
+def calculate_carbon_savings(annual_energy_MWh):
+    """Calculate carbon savings from wind energy"""
+    co2_savings_tons, equivalent_trees, cars_equivalent, homes_powered, percent_of_country = \
+        carbon_savings_core(annual_energy_MWh)
+
     return {
-        'co2_savings_tons': co2_savings_tons,
-        'equivalent_trees': equivalent_trees,
-        'cars_equivalent': cars_equivalent,
-        'homes_powered': homes_powered,
-        'percent_of_country': percent_of_country
+        'co2_savings_tons': float(co2_savings_tons),
+        'equivalent_trees': int(equivalent_trees),
+        'cars_equivalent': int(cars_equivalent),
+        'homes_powered': int(homes_powered),
+        'percent_of_country': float(percent_of_country)
     }
 
-def calculate_economic_factors(annual_energy_MWh, num_turbines=10, location_name=""):
-    """Calculate economic factors for a wind farm with more detail"""
-    # Base parameters
+# Location-based factors (offshore is more expensive but more productive):
+# capacity factor, cost per turbine (€), yearly maintenance as a share of installation cost
+SITE_ECONOMICS = {
+    'Atlantic': (0.48, 4800000, 0.035),  # Deep offshore - highest cost, highest productivity
+    'Offshore': (0.45, 4500000, 0.033),  # Ocean/Sea - high cost, good productivity
+    'Bay': (0.42, 4200000, 0.031),       # Near shore - medium cost, medium productivity
+    'Default': (0.43, 4300000, 0.032),   # Standard offshore
+}
+
+def economic_core(annual_energy_MWh, num_turbines, cost_per_turbine, maintenance_factor):
+    """
+    Costs and returns of a wind farm at one location
+
+    Returns (annual_revenue, installation_cost, grid_connection_cost,
+    planning_cost, total_cost, annual_maintenance, annual_profit,
+    payback_period).
+    """
     electricity_price = 150  # €/MWh
 
-    # Location-based factors (offshore is more expensive but more productive)
-    if "Atlantic" in location_name:
-        # Deep offshore - highest cost, highest productivity
-        capacity_factor = 0.48  # 48% efficiency
-        cost_per_turbine = 4800000  # €4.8 million per turbine
-        maintenance_factor = 0.035  # 3.5% of installation cost per year
-    elif "Ocean" in location_name or "Sea" in location_name:
-        # Offshore - high cost, good productivity
-        capacity_factor = 0.45  # 45% efficiency
-        cost_per_turbine = 4500000  # €4.5 million per turbine
-        maintenance_factor = 0.033  # 3.3% of installation cost per year
-    elif "Bay" in location_name:
-        # Near shore - medium cost, medium productivity
-        capacity_factor = 0.42  # 42% efficiency
-        cost_per_turbine = 4200000  # €4.2 million per turbine
-        maintenance_factor = 0.031  # 3.1% of installation cost per year
-    else:
-        # Default - standard offshore
-        capacity_factor = 0.43  # 43% efficiency
-        cost_per_turbine = 4300000  # €4.3 million per turbine
-        maintenance_factor = 0.032  # 3.2% of installation cost per year
-
     # Annual revenue
     annual_revenue = annual_energy_MWh * electricity_price
 
@@ -312,6 +505,17 @@ def calculate_economic_factors(annual_energy_MWh, num_turbines=10, location_name
     # Simple payback period (years)
     payback_period = total_cost / annual_profit
 
+    return (annual_revenue, installation_cost, grid_connection_cost, planning_cost,
+            total_cost, annual_maintenance, annual_profit, payback_period)
+
+def calculate_economic_factors(annual_energy_MWh, num_turbines=10, location_name=""):
+    """Calculate economic factors for a wind farm with more detail"""
+    capacity_factor, cost_per_turbine, maintenance_factor = SITE_ECONOMICS[classify_location(location_name)[1]]
+
+    (annual_revenue, installation_cost, grid_connection_cost, planning_cost,
+     total_cost, annual_maintenance, annual_profit, payback_period) = \
+        economic_core(annual_energy_MWh, num_turbines, cost_per_turbine, maintenance_factor)
+
     # Jobs created (construction and permanent)
     construction_jobs = num_turbines * 15  # 15 jobs per turbine during construction
     permanent_jobs = num_turbines * 0.5  # 0.5 permanent jobs per turbine
@@ -333,47 +537,56 @@ def calculate_economic_factors(annual_energy_MWh, num_turbines=10, location_name
 
 def generate_text_report(student_name, detective_rank, analyzed_locations, score):
     """Generate a simple text report"""
-    report_lines = []
-    report_lines.append("="*60)
-    report_lines.append("WIND DETECTIVE CHALLENGE - FINAL REPORT")
-    report_lines.append("="*60)
-    report_lines.append(f"Detective: {student_name}")
-    report_lines.append(f"Rank: {detective_rank}")
-    report_lines.append(f"Date: {datetime.now().strftime('%d %B %Y')}")
-    report_lines.append(f"Final Score: {score} points")
-    report_lines.append("-"*60)
+    import pandas as pd
+
+    report_lines = [
+        "="*60,
+        "WIND DETECTIVE CHALLENGE - FINAL REPORT",
+        "="*60,
+        f"Detective: {student_name}",
+        f"Rank: {detective_rank}",
+        f"Date: {datetime.now().strftime('%d %B %Y')}",
+        f"Final Score: {score} points",
+        "-"*60,
+    ]
 
     # Sort locations by average wind speed
-    sorted_locations = sorted(analyzed_locations,
-                            key=lambda x: x['avg_wind_speed'],
-                            reverse=True)
+    sorted_locations = sorted(analyzed_locations, key=itemgetter('avg_wind_speed'), reverse=True)
+    best = sorted_locations[0]
 
     # Add executive summary
-    report_lines.append("EXECUTIVE SUMMARY:")
-    report_lines.append("")
-
-    best_location = sorted_locations[0]['name']
-    report_lines.append(f"After analyzing {len(analyzed_locations)} offshore locations around Ireland,")
-    report_lines.append(f"we have determined that {best_location} offers the best potential for")
-    report_lines.append(f"wind energy development with an average wind speed of {sorted_locations[0]['avg_wind_speed']:.1f} m/s")
-    report_lines.append(f"and estimated annual energy production of {sorted_locations[0]['annual_energy_MWh']:.1f} MWh,")
-    report_lines.append(f"enough to power {sorted_locations[0]['homes_powered']} homes.")
+    report_lines.extend([
+        "EXECUTIVE SUMMARY:",
+        "",
+        f"After analyzing {len(analyzed_locations)} offshore locations around Ireland,",
+        f"we have determined that {best['name']} offers the best potential for",
+        f"wind energy development with an average wind speed of {best['avg_wind_speed']:.1f} m/s",
+        f"and estimated annual energy production of {best['annual_energy_MWh']:.1f} MWh,",
+        f"enough to power {best['homes_powered']} homes.",
+    ])
 
     # Add location rankings
-    report_lines.append("")
-    report_lines.append("-"*60)
-    report_lines.append("LOCATION RANKINGS (by average wind speed):")
-    report_lines.append("")
-
-    for i, location in enumerate(sorted_locations):
-        suitability = "SUITABLE" if location['is_suitable'] else "NOT SUITABLE"
-        report_lines.append(f"{i+1}. {location['name']} - {location['avg_wind_speed']:.1f} m/s - {suitability}")
+    report_lines.extend([
+        "",
+        "-"*60,
+        "LOCATION RANKINGS (by average wind speed):",
+        "",
+    ])
+
+    # Format the ranking lines column-wise rather than location by location
+    ranking = pd.DataFrame(sorted_locations, columns=['name', 'avg_wind_speed', 'is_suitable'])
+    ranks = pd.Series(np.arange(1, len(ranking) + 1)).astype(str)
+    suitability = np.where(ranking['is_suitable'], "SUITABLE", "NOT SUITABLE")
+    report_lines.extend(ranks + '. ' + ranking['name'] + ' - '
+                        + ranking['avg_wind_speed'].map('{:.1f}'.format) + ' m/s - ' + suitability)
 
     # Add recommendations
-    report_lines.append("")
-    report_lines.append("-"*60)
-    report_lines.append("RECOMMENDATIONS:")
-    report_lines.append("")
+    report_lines.extend([
+        "",
+        "-"*60,
+        "RECOMMENDATIONS:",
+        "",
+    ])
 
     recommended = [loc for loc in sorted_locations if loc['is_suitable']]
     if recommended:
@@ -396,51 +609,65 @@ def generate_text_report(student_name, detective_rank, analyzed_locations, score
         report_lines.append("None of the analyzed locations meet the minimum requirements for wind farms.")
 
     # Add detailed location information
-    report_lines.append("")
-    report_lines.append("-"*60)
-    report_lines.append("DETAILED LOCATION ANALYSIS:")
+    report_lines.extend([
+        "",
+        "-"*60,
+        "DETAILED LOCATION ANALYSIS:",
+    ])
 
     for i, location in enumerate(sorted_locations):
-        report_lines.append("")
-        report_lines.append(f"Location #{i+1}: {location['name']}")
-        report_lines.append(f"Average Wind Speed: {location['avg_wind_speed']:.1f} m/s")
-        report_lines.append(f"Average Power Output: {location['avg_power']:.1f} kW")
-        report_lines.append(f"Annual Energy Production: {location['annual_energy_MWh']:.1f} MWh")
-        report_lines.append(f"Homes Powered: {location['homes_powered']}")
+        report_lines.extend([
+            "",
+            f"Location #{i+1}: {location['name']}",
+            f"Average Wind Speed: {location['avg_wind_speed']:.1f} m/s",
+            f"Average Power Output: {location['avg_power']:.1f} kW",
+            f"Annual Energy Production: {location['annual_energy_MWh']:.1f} MWh",
+            f"Homes Powered: {location['homes_powered']}",
+        ])
 
         if 'best_season' in location:
-            report_lines.append(f"Best Season: {location['best_season']}")
-            report_lines.append(f"Worst Season: {location.get('worst_season', 'Unknown')}")
+            report_lines.extend([
+                f"Best Season: {location['best_season']}",
+                f"Worst Season: {location.get('worst_season', 'Unknown')}",
+            ])
 
         if 'direction_analysis' in location:
             da = location['direction_analysis']
-            report_lines.append(f"Dominant Wind Direction: {da['dominant']} ({da['dominant_percent']:.1f}%)")
-            report_lines.append(f"Secondary Wind Direction: {da['secondary']} ({da['secondary_percent']:.1f}%)")
+            report_lines.extend([
+                f"Dominant Wind Direction: {da['dominant']} ({da['dominant_percent']:.1f}%)",
+                f"Secondary Wind Direction: {da['secondary']} ({da['secondary_percent']:.1f}%)",
+            ])
 
         if 'environmental_impact' in location:
             ei = location['environmental_impact']
-            report_lines.append(f"CO2 Savings: {ei['co2_savings_tons']:.1f} tons/year")
-            report_lines.append(f"Equivalent to: {ei['equivalent_trees']} trees or {ei['cars_equivalent']} cars")
+            report_lines.extend([
+                f"CO2 Savings: {ei['co2_savings_tons']:.1f} tons/year",
+                f"Equivalent to: {ei['equivalent_trees']} trees or {ei['cars_equivalent']} cars",
+            ])
 
         if 'economic_data' in location:
             econ = location['economic_data']
-            report_lines.append(f"Economic Assessment:")
-            report_lines.append(f"  - Annual Revenue: €{econ['annual_revenue']:,.0f}")
-            report_lines.append(f"  - Total Cost: €{econ.get('total_cost', econ['installation_cost']):,.0f}")
-            report_lines.append(f"  - Annual Profit: €{econ['annual_profit']:,.0f}")
-            report_lines.append(f"  - Payback Period: {econ['payback_period']:.1f} years")
+            report_lines.extend([
+                f"Economic Assessment:",
+                f"  - Annual Revenue: €{econ['annual_revenue']:,.0f}",
+                f"  - Total Cost: €{econ.get('total_cost', econ['installation_cost']):,.0f}",
+                f"  - Annual Profit: €{econ['annual_profit']:,.0f}",
+                f"  - Payback Period: {econ['payback_period']:.1f} years",
+            ])
             if 'construction_jobs' in econ:
                 report_lines.append(f"  - Jobs Created: {econ['construction_jobs']} construction, {econ['permanent_jobs']} permanent")
 
     # Conclusion
-    report_lines.append("")
-    report_lines.append("-"*60)
-    report_lines.append("CONCLUSION:")
-    report_lines.append("")
-    report_lines.append("Ireland has significant potential for offshore wind energy development,")
-    report_lines.append("particularly along the western and northwestern coasts. Strategic")
-    report_lines.append("development of these resources would provide clean, renewable energy")
-    report_lines.append("for thousands of homes while creating jobs and reducing carbon emissions.")
+    report_lines.extend([
+        "",
+        "-"*60,
+        "CONCLUSION:",
+        "",
+        "Ireland has significant potential for offshore wind energy development,",
+        "particularly along the western and northwestern coasts. Strategic",
+        "development of these resources would provide clean, renewable energy",
+        "for thousands of homes while creating jobs and reducing carbon emissions.",
+    ])
 
     # Save to file
     report_filename = f"Wind_Detective_Report_{student_name.replace(' ', '_')}.txt"
@@ -503,12 +730,7 @@ def mini_game_turbine_efficiency():
         for j, option in enumerate(q['options']):
             print(f"{j+1}. {option}")
 
-        answer = -1
-        while answer < 1 or answer > len(q['options']):
-            try:
-                answer = int(input(f"\nYour answer (1-{len(q['options'])}): "))
-            except ValueError:
-                print("Please enter a valid number!")
+        answer = prompt_int(f"\nYour answer (1-{len(q['options'])}): ", 1, len(q['options']))
 
         # Check if correct (adjusting for 0-indexing)
         if answer - 1 == q['correct']:
@@ -559,12 +781,7 @@ def mini_game_design_challenge():
     for i, option in enumerate(options):
         print(f"{i+1}. {option}")
 
-    answer = -1
-    while answer < 1 or answer > len(options):
-        try:
-            answer = int(input(f"\nYour choice (1-{len(options)}): "))
-        except ValueError:
-            print("Please enter a valid number!")
+    answer = prompt_int(f"\nYour choice (1-{len(options)}): ", 1, len(options))
 
     if answer == 3:  # Correct answer is staggered grid
         print_slow("✓ EXCELLENT CHOICE! +10 points")
@@ -625,7 +842,7 @@ def run_wind_detective_game():
     # Game variables
     player_score = 0
     locations_analyzed = 0
-    detective_rank = "Beginner Wind Detective"
+    detective_rank = detective_rank_for(player_score)
     analyzed_locations = []
 
     # Introductory tutorial
@@ -654,11 +871,10 @@ def run_wind_detective_game():
     player_score += quiz_score
 
     # Update detective rank
-    if player_score >= 20:
-        detective_rank = "Wind Detective"
+    detective_rank = detective_rank_for(player_score)
 
     # Load all available datasets
-    location_files = [f for f in os.listdir() if f.endswith('_Wind_2024.xlsx')]
+    location_files = find_wind_data_files()
 
     if len(location_files) == 0:
         print_slow("Uh oh! No wind data files found! Make sure to run the data generator first.")
@@ -670,15 +886,9 @@ def run_wind_detective_game():
     print_slow(f"\nWe have data from {len(location_files)} offshore locations around Ireland.")
 
     max_locations = min(len(location_files), 8)
-    num_locations = 0
-
-    while num_locations < 3 or num_locations > max_locations:
-        try:
-            print_slow(f"\nHow many locations would you like to investigate? (3-{max_locations})")
-            print_slow("(More locations = more complete analysis, but will take longer)")
-            num_locations = int(input("Number of locations: "))
-        except ValueError:
-            print("Please enter a valid number!")
+    print_slow(f"\nHow many locations would you like to investigate? (3-{max_locations})")
+    print_slow("(More locations = more complete analysis, but will take longer)")
+    num_locations = prompt_int("Number of locations: ", 3, max_locations)
 
     print_slow(f"\nExcellent! You'll investigate {num_locations} offshore locations.")
     print_slow("The Minister will be impressed by your thorough analysis!")
@@ -689,28 +899,18 @@ def run_wind_detective_game():
     print("1. Choose specific locations")
     print("2. Investigate random locations")
 
-    selection_mode = 0
-    while selection_mode not in [1, 2]:
-        try:
-            selection_mode = int(input("\nEnter your choice (1-2): "))
-        except ValueError:
-            print("Please enter a valid number!")
+    selection_mode = prompt_int("\nEnter your choice (1-2): ", 1, 2)
 
     if selection_mode == 1:
         # Let student choose specific locations
         print_slow("\nAvailable locations:")
         for i, loc in enumerate(location_files, 1):
-            loc_name = loc.replace('_Wind_2024.xlsx', '').replace('_', ' ')
+            loc_name = location_name_from_file(loc)
             print(f"{i}. {loc_name}")
 
         selected_locations = []
         for i in range(num_locations):
-            choice = 0
-            while choice < 1 or choice > len(location_files):
-                try:
-                    choice = int(input(f"\nSelect location #{i+1}: "))
-                except ValueError:
-                    print("Please enter a valid number!")
+            choice = prompt_int(f"\nSelect location #{i+1}: ", 1, len(location_files))
             selected_locations.append(location_files[choice-1])
 
         location_files = selected_locations
@@ -719,17 +919,22 @@ def run_wind_detective_game():
         random.shuffle(location_files)
         location_files = location_files[:num_locations]
 
+    # Load and summarise every selected location up front, so the game loop
+    # below only presents results; a file that fails here keeps its error,
+    # which is reported (without reloading the file) when its turn comes
+    location_summaries = {}
+    for file_name in location_files:
+        try:
+            location_summaries[file_name] = summarize_location(file_name)
+        except (OSError, ValueError, KeyError) as e:
+            location_summaries[file_name] = e
+
     # Game loop
     while location_files and locations_analyzed < num_locations:
         clear_screen()
 
         # Current detective rank
-        if player_score >= 80:
-            detective_rank = "Master Wind Detective"
-        elif player_score >= 50:
-            detective_rank = "Senior Wind Detective"
-        elif player_score >= 20:
-            detective_rank = "Wind Detective"
+        detective_rank = detective_rank_for(player_score)
 
         print("\n" + "="*60)
         print_slow(f"🔍 LOCATION #{locations_analyzed + 1} INVESTIGATION 🔍")
@@ -741,7 +946,8 @@ def run_wind_detective_game():
 
         # Select the next location
         current_file = location_files.pop(0)
-        location_name = current_file.replace('_Wind_2024.xlsx', '').replace('_', ' ')
+        location_name = location_name_from_file(current_file)
+        location_data = location_summaries.pop(current_file)
 
         print_slow(f"You're investigating: {location_name}")
         print_slow("Let's examine the wind data and determine if this site is suitable!")
@@ -749,40 +955,27 @@ def run_wind_detective_game():
 
         # Load and analyze data
         try:
-            data = pd.read_excel(current_file)
-            months = data['Month']
-            wind_speeds = data['Wind Speed (m/s)']
-
-            # Calculate key stats
-            avg_wind_speed = wind_speeds.mean()
-            max_wind_speed = wind_speeds.max()
-            min_wind_speed = wind_speeds.min()
-            max_month = months[wind_speeds.idxmax()]
-            min_month = months[wind_speeds.idxmin()]
-
-            # Calculate wind power
-            def calculate_wind_power(wind_speed, turbine_diameter=100):
-                rho = 1.225  # Air density (kg/m³)
-                A = (np.pi * turbine_diameter**2) / 4  # Swept area (m²)
-                power_W = 0.5 * rho * A * (wind_speed**3)
-                return power_W / 1000  # Convert to kilowatts
-
-            wind_power_kW = [calculate_wind_power(speed) for speed in wind_speeds]
-            avg_power = sum(wind_power_kW) / len(wind_power_kW)
-
-            # Calculate annual energy
-            annual_energy_MWh = (avg_power * 8760) / 1000  # 8760 hours in a year
-            homes_powered = int(annual_energy_MWh / 4.2)  # Average Irish home uses ~4.2 MWh/year
-
-            # Is this site suitable? (offshore sites should have avg wind speed >= 7.0 m/s)
-            is_suitable = avg_wind_speed >= 7.0
+            if isinstance(location_data, Exception):
+                raise location_data
+            months = location_data['months']
+            wind_speeds = location_data['wind_speeds']
+            wind_power_kW = location_data['wind_power_kW']
+            avg_wind_speed = location_data['avg_wind_speed']
+            max_wind_speed = location_data['max_wind_speed']
+            min_wind_speed = location_data['min_wind_speed']
+            max_month = location_data['max_month']
+            min_month = location_data['min_month']
+            avg_power = location_data['avg_power']
+            annual_energy_MWh = location_data['annual_energy_MWh']
+            homes_powered = location_data['homes_powered']
+            is_suitable = location_data['is_suitable']
 
             # Display data summary with more detail
             print_slow("📊 WIND DATA SUMMARY:")
             print(f"  • Average wind speed: {avg_wind_speed:.1f} m/s")
             print(f"  • Highest wind speed: {max_wind_speed:.1f} m/s in {max_month}")
             print(f"  • Lowest wind speed: {min_wind_speed:.1f} m/s in {min_month}")
-            print(f"  • Wind speed variance: {np.var(wind_speeds):.2f} (lower = more consistent)")
+            print(f"  • Wind speed variance: {location_data['wind_speed_variance']:.2f} (lower = more consistent)")
             print(f"  • Average power output: {avg_power:.1f} kW")
             print(f"  • Estimated annual energy: {annual_energy_MWh:.1f} MWh")
             print(f"  • This could power approximately {homes_powered} homes")
@@ -791,10 +984,10 @@ def run_wind_detective_game():
             # Show a simple visualization of monthly wind speeds
             print_slow("Monthly Wind Speeds:")
             max_bar_length = 40
-            for i, speed in enumerate(wind_speeds):
-                bar_length = int((speed / max_wind_speed) * max_bar_length)
-                bar = "█" * bar_length
-                print(f"{months[i]:10}: {speed:.1f} m/s {bar}")
+            speeds = wind_speeds.to_numpy()
+            bar_lengths = (speeds / max_wind_speed * max_bar_length).astype(int)
+            print("\n".join(f"{month:10}: {speed:.1f} m/s {'█' * bar_length}"
+                            for month, speed, bar_length in zip(months, speeds, bar_lengths)))
 
             print("\n" + "-"*60)
 
@@ -839,38 +1032,11 @@ def run_wind_detective_game():
             print_slow("🔬 ADVANCED ANALYSIS OPTIONS:")
             print_slow("As a good detective, you can investigate further. What would you like to analyze next?")
 
-            analysis_options = [
-                "Seasonal wind patterns",
-                "Wind direction analysis",
-                "Environmental impact assessment",
-                "Economic feasibility study",
-                "Continue to next location"
-            ]
-
-            for i, option in enumerate(analysis_options):
+            for i, option in enumerate(ANALYSIS_OPTIONS):
                 print(f"{i+1}. {option}")
 
             # Get student's choice for additional analysis
-            choice = 0
-            while choice < 1 or choice > len(analysis_options):
-                try:
-                    choice = int(input(f"\nYour choice (1-{len(analysis_options)}): "))
-                except ValueError:
-                    print("Please enter a valid number!")
-
-            # Store basic location data
-            location_data = {
-                'name': location_name,
-                'file': current_file,
-                'months': months,
-                'wind_speeds': wind_speeds,
-                'wind_power_kW': wind_power_kW,
-                'avg_wind_speed': avg_wind_speed,
-                'avg_power': avg_power,
-                'annual_energy_MWh': annual_energy_MWh,
-                'homes_powered': homes_powered,
-                'is_suitable': is_suitable
-            }
+            choice = prompt_int(f"\nYour choice (1-{len(ANALYSIS_OPTIONS)}): ", 1, len(ANALYSIS_OPTIONS))
 
             # Perform additional analysis based on student's choice
             if choice == 1:  # Seasonal analysis
@@ -975,12 +1141,7 @@ def run_wind_detective_game():
             locations_analyzed += 1
 
             # Update detective rank
-            if player_score >= 80:
-                detective_rank = "Master Wind Detective"
-            elif player_score >= 50:
-                detective_rank = "Senior Wind Detective"
-            elif player_score >= 20:
-                detective_rank = "Wind Detective"
+            detective_rank = detective_rank_for(player_score)
 
             # Continue prompt
             print("\n" + "-"*60)
@@ -996,12 +1157,7 @@ def run_wind_detective_game():
     player_score += design_score
 
     # Update detective rank one last time
-    if player_score >= 80:
-        detective_rank = "Master Wind Detective"
-    elif player_score >= 50:
-        detective_rank = "Senior Wind Detective"
-    elif player_score >= 20:
-        detective_rank = "Wind Detective"
+    detective_rank = detective_rank_for(player_score)
 
     # Generate final report
     clear_screen()
@@ -1039,13 +1195,14 @@ def run_wind_detective_game():
         print_slow("📊 WIND DETECTIVE FINAL REPORT 📊", 0.05)
         print("="*60)
 
-        print_slow(f"Detective: {student_name}")
-        print_slow(f"Rank: {detective_rank}")
-        print_slow(f"Date: {datetime.now().strftime('%d %B %Y')}")
-        print_slow(f"Final Score: {player_score} points")
+        # The summary is reference text, so it is printed at once rather than typed out
+        print(f"Detective: {student_name}")
+        print(f"Rank: {detective_rank}")
+        print(f"Date: {datetime.now().strftime('%d %B %Y')}")
+        print(f"Final Score: {player_score} points")
 
-        print_slow("\n" + "-"*60)
-        print_slow("EXECUTIVE SUMMARY:")
+        print("\n" + "-"*60)
+        print("EXECUTIVE SUMMARY:")
 
         # Sort locations by average wind speed
         sorted_locations = sorted(analyzed_locations,
@@ -1055,29 +1212,29 @@ def run_wind_detective_game():
         best_location = sorted_locations[0]['name']
         worst_location = sorted_locations[-1]['name']
 
-        print_slow(f"\nAfter analyzing {len(analyzed_locations)} offshore locations around Ireland,")
-        print_slow(f"we have determined that {best_location} offers the best potential for")
-        print_slow(f"wind energy development with an average wind speed of {sorted_locations[0]['avg_wind_speed']:.1f} m/s")
-        print_slow(f"and estimated annual energy production of {sorted_locations[0]['annual_energy_MWh']:.1f} MWh,")
-        print_slow(f"enough to power {sorted_locations[0]['homes_powered']} homes.")
+        print(f"\nAfter analyzing {len(analyzed_locations)} offshore locations around Ireland,")
+        print(f"we have determined that {best_location} offers the best potential for")
+        print(f"wind energy development with an average wind speed of {sorted_locations[0]['avg_wind_speed']:.1f} m/s")
+        print(f"and estimated annual energy production of {sorted_locations[0]['annual_energy_MWh']:.1f} MWh,")
+        print(f"enough to power {sorted_locations[0]['homes_powered']} homes.")
 
-        print_slow("\n" + "-"*60)
-        print_slow("LOCATION RANKINGS (by average wind speed):")
+        print("\n" + "-"*60)
+        print("LOCATION RANKINGS (by average wind speed):")
 
         for i, location in enumerate(sorted_locations):
             suitability = "SUITABLE" if location['is_suitable'] else "NOT SUITABLE"
-            print_slow(f"{i+1}. {location['name']} - {location['avg_wind_speed']:.1f} m/s - {suitability}")
+            print(f"{i+1}. {location['name']} - {location['avg_wind_speed']:.1f} m/s - {suitability}")
 
-        print_slow("\n" + "-"*60)
-        print_slow("RECOMMENDATIONS:")
+        print("\n" + "-"*60)
+        print("RECOMMENDATIONS:")
 
-        print_slow(f"\nBased on our analysis, we recommend developing wind farms at:")
+        print(f"\nBased on our analysis, we recommend developing wind farms at:")
         for i in range(min(3, len(sorted_locations))):
             if sorted_locations[i]['is_suitable']:
-                print_slow(f"{i+1}. {sorted_locations[i]['name']}")
+                print(f"{i+1}. {sorted_locations[i]['name']}")
 
-        print_slow("\nThese sites offer the best combination of strong and consistent")
-        print_slow("wind resources, which would maximize renewable energy generation.")
+        print("\nThese sites offer the best combination of strong and consistent")
+        print("wind resources, which would maximize renewable energy generation.")
 
     # Game finale
     print("\n" + "-"*60)
@@ -9,6 +9,7 @@ Date: 2025-05-07
 import pandas as pd
 import numpy as np
 from scipy.interpolate import griddata
+from scipy.spatial import cKDTree
 import matplotlib.pyplot as plt
 import os
 
@@ -16,45 +17,78 @@ import os
 input_files = ['Topo.xyz', 'HY-TOPO.xyz', 'hydro-5m.xyz']  # List your XYZ files here
 output_file = 'merged_gridded_output.xyz'                  # Output file name
 grid_spacing = 5                                           # Grid resolution (in same units as X, Y)
+interp_method = 'nearest'                                  # Options: 'nearest', 'linear', 'cubic'
+show_plots = True                                          # Preview raw and gridded data (set False for batch runs)
+max_plot_points = 50_000                                   # Points drawn per preview plot (random subsample)
 
 # === LOAD AND MERGE DATA ===
-df_list = []
+def count_lines(path):
+    """Upper bound on the number of points in an XYZ file (one per line)."""
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b'')) + 1
+
+existing_files = []
 for file in input_files:
     if os.path.exists(file):
-        df = pd.read_csv(file, sep=r'\s+|\t+', engine='python', header=None, names=['X', 'Y', 'Z'])
-        df_list.append(df)
+        existing_files.append(file)
     else:
         print(f"Warning: {file} not found. Skipping.")
 
+# Each file is copied into one preallocated buffer as it is read, so only the
+# merged points plus a single file are held in memory at once
+xyz_combined = np.empty((sum(count_lines(file) for file in existing_files), 3), dtype=np.float64)
+n_points = 0
+for file in existing_files:
+    # Whitespace-separated X Y Z columns parsed straight into a float array
+    xyz = np.loadtxt(file, dtype=np.float64, ndmin=2)
+    xyz_combined[n_points:n_points + len(xyz)] = xyz
+    n_points += len(xyz)
+    del xyz
+
 # Combine all XYZ points
-df_combined = pd.concat(df_list, ignore_index=True)
+xyz_combined = xyz_combined[:n_points]
+X, Y, Z = xyz_combined[:, 0], xyz_combined[:, 1], xyz_combined[:, 2]
+
+def preview_sample(n_points):
+    """Indices of at most max_plot_points points to draw, so previews stay fast on large clouds."""
+    if n_points <= max_plot_points:
+        return slice(None)
+    return np.random.default_rng(0).choice(n_points, size=max_plot_points, replace=False)
 
 # === VISUALIZE RAW MERGED DATA ===
-plt.figure(figsize=(10, 8))
-sc = plt.scatter(df_combined['X'], df_combined['Y'], c=df_combined['Z'], cmap='terrain', s=5)
-plt.colorbar(sc, label='Elevation / Depth (m)')
-plt.title('Merged Raw Terrain Data')
-plt.xlabel('X')
-plt.ylabel('Y')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+if show_plots:
+    sample = preview_sample(len(X))
+    plt.figure(figsize=(10, 8))
+    sc = plt.scatter(X[sample], Y[sample], c=Z[sample], cmap='terrain', s=5)
+    plt.colorbar(sc, label='Elevation / Depth (m)')
+    plt.title('Merged Raw Terrain Data')
+    plt.xlabel('X')
+    plt.ylabel('Y')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
 
 # === DEFINE REGULAR GRID ===
-xmin, xmax = df_combined['X'].min(), df_combined['X'].max()
-ymin, ymax = df_combined['Y'].min(), df_combined['Y'].max()
+xmin, xmax = X.min(), X.max()
+ymin, ymax = Y.min(), Y.max()
 
 grid_x = np.arange(xmin, xmax, grid_spacing)
 grid_y = np.arange(ymin, ymax, grid_spacing)
 grid_X, grid_Y = np.meshgrid(grid_x, grid_y)
 
 # === INTERPOLATE ONTO GRID ===
-grid_Z = griddata(
-    (df_combined['X'], df_combined['Y']),
-    df_combined['Z'],
-    (grid_X, grid_Y),
-    method='nearest'  # Options: 'nearest', 'linear', 'cubic'
-)
+if interp_method == 'nearest':
+    # Nearest neighbour straight from a KD-tree query, spread over all CPU cores
+    tree = cKDTree(np.column_stack((X, Y)))
+    _, nearest = tree.query(np.column_stack((grid_X.ravel(), grid_Y.ravel())), k=1, workers=-1)
+    grid_Z = Z[nearest].reshape(grid_X.shape)
+else:
+    grid_Z = griddata(
+        (X, Y),
+        Z,
+        (grid_X, grid_Y),
+        method=interp_method
+    )
 
 # === CONVERT TO FLAT XYZ FORMAT ===
 df_grid = pd.DataFrame({
@@ -68,12 +102,15 @@ df_grid.to_csv(output_file, sep='\t', index=False, header=False)
 print(f"\n✅ Gridded output saved to: {output_file}")
 
 # === VISUALIZE FINAL GRID ===
-plt.figure(figsize=(10, 8))
-sc_grid = plt.scatter(df_grid['X'], df_grid['Y'], c=df_grid['Z'], cmap='terrain', s=5)
-plt.colorbar(sc_grid, label='Interpolated Elevation / Depth (m)')
-plt.title('Gridded Terrain Surface')
-plt.xlabel('X')
-plt.ylabel('Y')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+if show_plots:
+    sample = preview_sample(len(df_grid))
+    plt.figure(figsize=(10, 8))
+    sc_grid = plt.scatter(df_grid['X'].to_numpy()[sample], df_grid['Y'].to_numpy()[sample],
+                          c=df_grid['Z'].to_numpy()[sample], cmap='terrain', s=5)
+    plt.colorbar(sc_grid, label='Interpolated Elevation / Depth (m)')
+    plt.title('Gridded Terrain Surface')
+    plt.xlabel('X')
+    plt.ylabel('Y')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
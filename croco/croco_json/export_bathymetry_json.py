@@ -3,31 +3,59 @@
 
 
 
+import os
 import xarray as xr
 import numpy as np
 import json
 
+# orjson is optional; without it the arrays go through the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load your CROCO grid file
 file_path = '/content/croco_grd.nc'
-ds = xr.open_dataset(file_path)
-
-# Extract bathymetry and coordinates
-h = ds['h'].values
-lon = ds['lon_rho'].values
-lat = ds['lat_rho'].values
-
-# Use all data points (no subsampling)
-lon_sub = lon.flatten().tolist()
-lat_sub = lat.flatten().tolist()
-h_sub = (-h).flatten().tolist()  # Negative values for depth
-
-# Create a dictionary to hold the data
-bathymetry_data = {
-    "x": lon_sub,
-    "y": lat_sub,
-    "z": h_sub
-}
-
-# Save to JSON file
-with open('bathymetry.json', 'w') as f:
-    json.dump(bathymetry_data, f)
+output_dir = '.'
+
+
+def read_bathymetry(path, N=1):
+    """Return the lon, lat and negative depth of every N-th rho point in *path*."""
+    # The dataset is opened lazily, so only the subsampled points are read from disk
+    with xr.open_dataset(path) as ds:
+        sub = ds[['h', 'lon_rho', 'lat_rho']].isel(
+            eta_rho=slice(None, None, N), xi_rho=slice(None, None, N)
+        ).load()
+
+    x = sub['lon_rho'].values.ravel()
+    y = sub['lat_rho'].values.ravel()
+    z = (-sub['h'].values).ravel()  # Negative values for depth
+    return x, y, z
+
+
+def export(path, N=1, output_dir='.'):
+    """Write bathymetry.bin and the bathymetry.json fallback for *path* to *output_dir*."""
+    x, y, z = read_bathymetry(path, N)
+
+    # Save as one Float32 block laid out [x..., y..., z...]; the page reads it
+    # with a single fetch + Float32Array view instead of parsing JSON text
+    np.stack([x, y, z]).astype(np.float32).tofile(
+        os.path.join(output_dir, 'bathymetry.bin'))
+
+    # The JSON copy is only the fallback the page fetches when the .bin fails
+    bathymetry_data = {"x": x, "y": y, "z": z}
+    json_file = os.path.join(output_dir, 'bathymetry.json')
+    if orjson is not None:
+        # Serialize the numpy arrays directly, without one Python float per element
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(bathymetry_data, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump({key: values.tolist() for key, values in bathymetry_data.items()}, f)
+
+
+if __name__ == '__main__':
+    # Use all data points (no subsampling). The files in assets/data were built
+    # this way from assets/data/croco_grd.nc (216 x 231 = 49896 points), with
+    # file_path and output_dir pointed at that directory
+    export(file_path, N=1, output_dir=output_dir)
@@ -10,54 +10,57 @@ Usage: python croco_grid_visualizer.py
 # 📚 Import libraries
 import xarray as xr
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
 # 📂 Load CROCO grid NetCDF file
 file_path = '/content/croco_grd_updated.nc'  # Update this path as needed
-ds = xr.open_dataset(file_path)
+# Only the four rho-point variables used below are read; the file is closed once they are loaded
+with xr.open_dataset(file_path) as ds:
+    grid = ds[['h', 'lon_rho', 'lat_rho', 'mask_rho']].load()
 
 # 🌊 Extract grid variables
-h = ds['h'].values                  # Bathymetry (depth)
-lon = ds['lon_rho'].values         # Longitude grid
-lat = ds['lat_rho'].values         # Latitude grid
-mask_rho = ds['mask_rho'].values   # Land-sea mask: 1 = ocean, 0 = land
+h = grid['h'].values                  # Bathymetry (depth)
+lon = grid['lon_rho'].values         # Longitude grid
+lat = grid['lat_rho'].values         # Latitude grid
+mask_rho = grid['mask_rho'].values   # Land-sea mask: 1 = ocean, 0 = land
 
 # 📊 Bathymetry Statistics
+# NaNs are dropped once, so each statistic runs over the compact valid depths
+h_nan = np.isnan(h)
+h_valid = h[~h_nan]
 bathymetry_stats = {
-    'Min Depth (m)': np.nanmin(h),
-    'Max Depth (m)': np.nanmax(h),
-    'Mean Depth (m)': np.nanmean(h),
-    'Std Deviation (m)': np.nanstd(h),
-    'Median Depth (m)': np.nanmedian(h),
-    'NaNs in h': int(np.isnan(h).sum()),
+    'Min Depth (m)': h_valid.min(),
+    'Max Depth (m)': h_valid.max(),
+    'Mean Depth (m)': h_valid.mean(),
+    'Std Deviation (m)': h_valid.std(),
+    'Median Depth (m)': np.median(h_valid),
+    'NaNs in h': int(h_nan.sum()),
     'NaNs in mask_rho': int(np.isnan(mask_rho).sum())
 }
 print("=== Bathymetry Statistics ===")
-print(pd.DataFrame([bathymetry_stats]))
+for name, value in bathymetry_stats.items():
+    print(f"{name}: {value}")
 
 # 🖼️ Plot 1: Land-Sea Mask
-plt.figure(figsize=(10, 6))
-plt.pcolormesh(lon, lat, mask_rho, shading='auto', cmap='Greys')
-plt.colorbar(label='Land-Sea Mask (1=Ocean, 0=Land)')
-plt.title('Grid with Land-Sea Mask')
-plt.xlabel('Longitude')
-plt.ylabel('Latitude')
-plt.tight_layout()
-plt.savefig('land_sea_mask.png', dpi=300)
+# rasterized=True keeps the mesh as a single image if a figure is saved to PDF/SVG
+fig, ax = plt.subplots(figsize=(10, 6))
+mesh = ax.pcolormesh(lon, lat, mask_rho, shading='auto', cmap='Greys', rasterized=True)
+fig.colorbar(mesh, ax=ax, label='Land-Sea Mask (1=Ocean, 0=Land)')
+ax.set_title('Grid with Land-Sea Mask')
+ax.set_xlabel('Longitude')
+ax.set_ylabel('Latitude')
+fig.tight_layout()
+fig.savefig('land_sea_mask.png', dpi=300)
 plt.show()
 
 # 🖼️ Plot 2: Bathymetry with Land-Sea Mask Overlay
-plt.figure(figsize=(10, 6))
-plt.pcolormesh(lon, lat, h, shading='auto', cmap='viridis')
-plt.colorbar(label='Depth (m)')
-plt.contour(lon, lat, mask_rho, levels=[0.5], colors='red', linewidths=1.0)
-plt.title('Bathymetry with Land-Sea Mask Overlay')
-plt.xlabel('Longitude')
-plt.ylabel('Latitude')
-plt.tight_layout()
-plt.savefig('bathymetry_with_mask.png', dpi=300)
+fig, ax = plt.subplots(figsize=(10, 6))
+mesh = ax.pcolormesh(lon, lat, h, shading='auto', cmap='viridis', rasterized=True)
+fig.colorbar(mesh, ax=ax, label='Depth (m)')
+ax.contour(lon, lat, mask_rho, levels=[0.5], colors='red', linewidths=1.0)
+ax.set_title('Bathymetry with Land-Sea Mask Overlay')
+ax.set_xlabel('Longitude')
+ax.set_ylabel('Latitude')
+fig.tight_layout()
+fig.savefig('bathymetry_with_mask.png', dpi=300)
 plt.show()
-
-# ✅ Close dataset
-ds.close()
@@ -25,7 +25,7 @@ uploaded = files.upload()
 
 # === Step 2: Read the file ===
 filename = 'TidalCurrents_1995_2024_hourly.csv'
-df = pd.read_csv(filename)
+df = pd.read_csv(filename, usecols=['Vel_Total'])  # Only the velocity column is needed
 
 # === Step 3: Extract Umax from Vel_Total column ===
 Umax = df['Vel_Total'].max()
@@ -56,16 +56,10 @@ print(f" Rated power (Pr)     : {Pr:.0f} W ≈ {Pr_kW:.2f} kW")
 
 # === 5. Generate speed range up to cut-out
 speeds = np.arange(0.0, Vco + 0.01, 0.01)
-powers = []
-
-for u in speeds:
-    if u < Vs or u > Vco:
-        P = 0.0
-    elif u <= Vr:
-        P = 0.5 * rho * Cp * A * u**3
-    else:  # Between Vr and Vco
-        P = Pr
-    powers.append(P / 1000.0)  # convert to kW
+# Capping u at Vr turns the rated plateau into the same cubic expression
+operating = (speeds >= Vs) & (speeds <= Vco)
+u_eff = np.minimum(speeds, Vr)
+powers = np.where(operating, 0.5 * rho * Cp * A * u_eff**3, 0.0) / 1000.0  # convert to kW
 
 # === 6. Save results to CSV
 df = pd.DataFrame({